@@ -9,7 +9,7 @@ from auth import (
     logout_user
 )
 from content_input import render_content_input_interface
-from content_generator import render_content_generation_interface
+from content_generator_ui import render_content_generation_interface
 from seo_settings import render_complete_seo_settings
 from style_customization import render_complete_style_customization
 from output_editor import render_complete_output_editor
@@ -2,10 +2,25 @@ import streamlit as st
 import hashlib
 import json
 import os
+import re
 from datetime import datetime, timedelta
 import uuid
 from typing import Dict, Optional, Tuple
 
+# Compiled once at import; checked on every registration submit
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Registration checks as (rejects(username, password, email), message), in reporting order;
+# they are called lazily, so later checks only run once the earlier ones pass
+_REGISTRATION_RULES = (
+    (lambda username, password, email: not username or len(username) < 3,
+     "Username must be at least 3 characters long"),
+    (lambda username, password, email: not password or len(password) < 6,
+     "Password must be at least 6 characters long"),
+    (lambda username, password, email: not email or not _EMAIL_RE.match(email),
+     "Please enter a valid email address"),
+)
+
 class AuthenticationManager:
     """Enhanced authentication system with proper security"""
     
@@ -92,15 +107,10 @@ class AuthenticationManager:
     
     def register_user(self, username: str, password: str, email: str) -> Tuple[bool, str]:
         """Register new user"""
-        # Validation
-        if not username or len(username) < 3:
-            return False, "Username must be at least 3 characters long"
-        
-        if not password or len(password) < 6:
-            return False, "Password must be at least 6 characters long"
-        
-        if not email or "@" not in email:
-            return False, "Please enter a valid email address"
+        # Validation - first failure wins, later checks are skipped
+        for rejects, message in _REGISTRATION_RULES:
+            if rejects(username, password, email):
+                return False, message
         
         if username in self.users_data:
             return False, "Username already exists"
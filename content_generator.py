@@ -1,9 +1,305 @@
-import streamlit as st
+from __future__ import annotations
+
+import copy
+import hashlib
+import io
 import re
 import random
+from bisect import bisect_right
+from string import Formatter
+from collections import Counter, OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-import json
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator, fall back to str.count
+    ahocorasick = None
+
+# Markdown structure patterns used by the SEO scoring passes
+_H2_RE = re.compile(r'^## ', re.M)
+_HEADING_RE = re.compile(r'^## (.+)$', re.M)
+_WORD_RE = re.compile(r'\S+')
+
+
+# Placeholders filled in title, meta and heading patterns
+_PLACEHOLDER_RE = re.compile(
+    r'\{(keyword|year|number|adjective|action|benefit|timeframe|call_to_action|result|additional_benefit)\}'
+)
+
+
+def _render_template(template: str, values: Dict[str, str]) -> str:
+    """Fill placeholders in one pass, leaving any without a value untouched"""
+    return _PLACEHOLDER_RE.sub(lambda match: values.get(match.group(1), match.group(0)), template)
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words without materializing the word list"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def _keyword_variations(primary_keyword: str) -> List[str]:
+    """Natural variations woven in when the primary keyword is underused"""
+    return [f"effective {primary_keyword}", f"{primary_keyword} strategies"]
+
+
+@lru_cache(maxsize=64)
+def _keyword_automaton(patterns: Tuple[str, ...]):
+    """Build the Aho-Corasick automaton for a keyword set once and reuse it across scans"""
+    automaton = ahocorasick.Automaton()
+    for kw in patterns:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_keywords(text_lower: str, keywords: List[str]) -> Counter:
+    """Count every keyword in lowercased text with a single Aho-Corasick scan"""
+    patterns = {kw.lower() for kw in keywords if kw}
+    if ahocorasick is None or not patterns:
+        return Counter({kw: text_lower.count(kw) for kw in patterns})
+    
+    automaton = _keyword_automaton(tuple(sorted(patterns)))
+    return Counter(kw for _, kw in automaton.iter(text_lower))
+
+
+@lru_cache(maxsize=16)
+def _source_sentences(source_text: str) -> Tuple[str, ...]:
+    """Split a source text once; the introduction and definition sections both read it"""
+    return tuple(source_text.split('.'))
+
+
+@lru_cache(maxsize=16)
+def _source_digest(source_text: str) -> str:
+    """BLAKE2 fingerprint of a source text for prompt cache keys"""
+    return hashlib.blake2b(source_text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=128)
+def _schema_markup_base(title: str, description: str, keyword: str) -> Dict:
+    """Build the date-independent, flat part of the JSON-LD schema
+    
+    Only immutable values live here; nested objects are created per call by
+    generate_schema_markup, so callers can never mutate a cached entry.
+    """
+    return {
+        "@context": "https://schema.org",
+        "@type": "Article",
+        "headline": title,
+        "description": description,
+        "keywords": keyword
+    }
+
+
+# Lower score bounds of each letter grade above F, ascending
+_GRADE_THRESHOLDS = (50, 60, 70, 80, 90)
+_GRADES = ("F", "D", "C", "B", "A", "A+")
+
+
+# Content templates for different article types, built once at import
+_CONTENT_TEMPLATES = {
+    "blog_post": {
+        "structure": [
+            "introduction",
+            "main_content_sections",
+            "conclusion",
+            "call_to_action"
+        ],
+        "intro_hooks": [
+            "Did you know that {statistic}?",
+            "Have you ever wondered {question}?",
+            "In today's {context}, {main_topic} has become more important than ever.",
+            "{Primary_keyword} is transforming the way we {action}.",
+            "The ultimate guide to {main_topic} starts here."
+        ]
+    },
+    "review": {
+        "structure": [
+            "product_overview",
+            "key_features",
+            "pros_and_cons",
+            "comparison",
+            "final_verdict"
+        ],
+        "intro_hooks": [
+            "Looking for an honest {product_type} review?",
+            "After {time_period} of testing {product_name}, here's what we found.",
+            "Is {product_name} worth your money? Let's find out.",
+            "{Product_name} promises {benefit} - but does it deliver?"
+        ]
+    },
+    "how_to_guide": {
+        "structure": [
+            "overview",
+            "requirements",
+            "step_by_step",
+            "tips_and_tricks",
+            "conclusion"
+        ],
+        "intro_hooks": [
+            "Learning {skill} doesn't have to be complicated.",
+            "Master {topic} with this comprehensive guide.",
+            "Follow these {number} simple steps to {achieve_goal}.",
+            "Ready to {action}? Here's everything you need to know."
+        ]
+    },
+    "landing_page": {
+        "structure": [
+            "headline",
+            "problem_solution",
+            "benefits",
+            "social_proof",
+            "call_to_action"
+        ],
+        "intro_hooks": [
+            "Transform your {area} with {solution}.",
+            "Stop struggling with {problem} - there's a better way.",
+            "Join {number}+ people who have {achieved_result}.",
+            "The {adjective} solution to {problem} is finally here."
+        ]
+    }
+}
+
+# Keyword-derived values for intro hook placeholders; any other placeholder is kept verbatim
+_HOOK_FIELDS = {
+    "Primary_keyword": lambda keyword: keyword.title(),
+    "main_topic": lambda keyword: keyword
+}
+
+
+def _compile_hook(template: str) -> Callable[[str], str]:
+    """Partially evaluate a hook template into a renderer taking only the primary keyword"""
+    segments = []
+    for literal, field, _, _ in Formatter().parse(template):
+        if literal:
+            segments.append(literal)
+        if field is not None:
+            segments.append(_HOOK_FIELDS.get(field, "{" + field + "}"))
+    
+    # Fold adjacent literals so rendering only joins around the keyword slots
+    folded = []
+    for segment in segments:
+        if folded and isinstance(segment, str) and isinstance(folded[-1], str):
+            folded[-1] += segment
+        else:
+            folded.append(segment)
+    
+    if all(isinstance(segment, str) for segment in folded):
+        rendered = ''.join(folded)
+        return lambda primary_keyword: rendered
+    
+    return lambda primary_keyword: ''.join(
+        segment if isinstance(segment, str) else segment(primary_keyword) for segment in folded
+    )
+
+
+# Specialized intro hook renderers per content type, built once at import
+_INTRO_RENDERERS = {
+    content_type: tuple(_compile_hook(hook) for hook in template["intro_hooks"])
+    for content_type, template in _CONTENT_TEMPLATES.items()
+}
+
+# SEO optimization patterns, built once at import
+_SEO_PATTERNS = {
+    "title_patterns": [
+        "{number} {adjective} Ways to {action} {keyword}",
+        "The Ultimate Guide to {keyword} in {year}",
+        "How to {action} {keyword}: {benefit}",
+        "{keyword}: Everything You Need to Know",
+        "{adjective} {keyword} Tips for {target_audience}",
+        "Why {keyword} is {adjective} for {context}",
+        "{keyword} vs {alternative}: Which is Better?"
+    ],
+    "heading_patterns": {
+        "h2": [
+            "What is {keyword}?",
+            "Benefits of {keyword}",
+            "How to {action} {keyword}",
+            "{keyword} Best Practices",
+            "Common {keyword} Mistakes to Avoid",
+            "{keyword} Tips and Tricks",
+            "The Future of {keyword}"
+        ],
+        "h3": [
+            "{specific_aspect} of {keyword}",
+            "Step {number}: {action}",
+            "{keyword} for {specific_use_case}",
+            "Advanced {keyword} Techniques"
+        ]
+    },
+    "meta_patterns": [
+        "Learn {keyword} with our comprehensive guide. {benefit} in {timeframe}. {call_to_action}.",
+        "Discover {adjective} {keyword} strategies that {result}. Expert tips and {benefit}.",
+        "{keyword} made simple. {benefit} with proven methods. {call_to_action}.",
+        "Master {keyword} with this {adjective} guide. {benefit} and {additional_benefit}."
+    ]
+}
+
+
+class PromptCache:
+    """In-memory LRU cache of generated articles, keyed on the generation settings
+
+    Exact hits match the canonical settings tuple, primary keyword casing included.
+    Near misses, entries whose settings agree on everything but a primary keyword
+    sharing most of its words (compared case-insensitively), are offered by
+    ``get_similar`` so the caller can adapt a cached article instead of generating
+    from scratch. The cache lives in one session's state
+    and is never written to disk.
+    """
+
+    NEAR_THRESHOLD = 0.5
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def make_key(source_content: Dict, seo_settings: Dict) -> Tuple:
+        """Canonical cache key for one generation request"""
+        source_hash = _source_digest(source_content.get('content', ''))
+        return (
+            seo_settings.get('primary_keyword', '').strip(),
+            seo_settings.get('tone', 'professional'),
+            seo_settings.get('content_type', 'blog_post'),
+            seo_settings.get('content_length', 0),
+            source_hash,
+            tuple(sorted(seo_settings.get('secondary_keywords', []))),
+        )
+
+    def get(self, key: Tuple) -> Optional[Dict]:
+        """Return a copy of the cached article for ``key``, or None on a miss"""
+        result = self._entries.get(key)
+        if result is None:
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def get_similar(self, key: Tuple) -> Optional[Dict]:
+        """Return a copy of a near-miss article for ``key``, or None if nothing is close"""
+        words = set(key[0].lower().split())
+        best, best_score = None, self.NEAR_THRESHOLD
+        for cached_key, result in self._entries.items():
+            if cached_key[1:] != key[1:] or cached_key == key:
+                continue
+            cached_words = set(cached_key[0].lower().split())
+            union = words | cached_words
+            score = len(words & cached_words) / len(union) if union else 0.0
+            if score >= best_score:
+                best, best_score = result, score
+        return copy.deepcopy(best) if best is not None else None
+
+    def put(self, key: Tuple, result: Dict) -> None:
+        """Store a generated article, evicting the least recently used beyond maxsize"""
+        self._entries[key] = copy.deepcopy(result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        self._entries.clear()
+
 
 class SEOContentGenerator:
     """Advanced SEO content generation engine"""
@@ -11,184 +307,210 @@ class SEOContentGenerator:
     def __init__(self):
         self.content_templates = self.load_content_templates()
         self.seo_patterns = self.load_seo_patterns()
+        self._intro_renderers = _INTRO_RENDERERS
+        
+        # Content type specific word banks for titles and meta descriptions
+        self._title_adjectives = {
+            "blog_post": ("Essential", "Proven", "Expert", "Complete", "Advanced"),
+            "review": ("Honest", "Detailed", "Comprehensive", "In-Depth", "Unbiased"),
+            "how_to_guide": ("Step-by-Step", "Complete", "Beginner's", "Ultimate", "Simple"),
+            "landing_page": ("Revolutionary", "Game-Changing", "Powerful", "Innovative", "Premium")
+        }
         
-    def load_content_templates(self) -> Dict:
-        """Load content templates for different article types"""
-        return {
-            "blog_post": {
-                "structure": [
-                    "introduction",
-                    "main_content_sections",
-                    "conclusion",
-                    "call_to_action"
-                ],
-                "intro_hooks": [
-                    "Did you know that {statistic}?",
-                    "Have you ever wondered {question}?",
-                    "In today's {context}, {main_topic} has become more important than ever.",
-                    "{Primary_keyword} is transforming the way we {action}.",
-                    "The ultimate guide to {main_topic} starts here."
-                ]
-            },
-            "review": {
-                "structure": [
-                    "product_overview",
-                    "key_features",
-                    "pros_and_cons",
-                    "comparison",
-                    "final_verdict"
-                ],
-                "intro_hooks": [
-                    "Looking for an honest {product_type} review?",
-                    "After {time_period} of testing {product_name}, here's what we found.",
-                    "Is {product_name} worth your money? Let's find out.",
-                    "{Product_name} promises {benefit} - but does it deliver?"
-                ]
-            },
-            "how_to_guide": {
-                "structure": [
-                    "overview",
-                    "requirements",
-                    "step_by_step",
-                    "tips_and_tricks",
-                    "conclusion"
-                ],
-                "intro_hooks": [
-                    "Learning {skill} doesn't have to be complicated.",
-                    "Master {topic} with this comprehensive guide.",
-                    "Follow these {number} simple steps to {achieve_goal}.",
-                    "Ready to {action}? Here's everything you need to know."
-                ]
-            },
-            "landing_page": {
-                "structure": [
-                    "headline",
-                    "problem_solution",
-                    "benefits",
-                    "social_proof",
-                    "call_to_action"
-                ],
-                "intro_hooks": [
-                    "Transform your {area} with {solution}.",
-                    "Stop struggling with {problem} - there's a better way.",
-                    "Join {number}+ people who have {achieved_result}.",
-                    "The {adjective} solution to {problem} is finally here."
-                ]
-            }
+        self._title_actions = {
+            "blog_post": ("Master", "Improve", "Optimize", "Boost", "Transform"),
+            "review": ("Choose", "Compare", "Evaluate", "Select", "Find"),
+            "how_to_guide": ("Learn", "Master", "Create", "Build", "Achieve"),
+            "landing_page": ("Transform", "Revolutionize", "Supercharge", "Optimize", "Enhance")
+        }
+        
+        self._meta_benefits = {
+            "blog_post": ("increase engagement", "boost performance", "improve results"),
+            "review": ("make informed decisions", "save time and money", "choose the best option"),
+            "how_to_guide": ("get started quickly", "avoid common mistakes", "achieve better results"),
+            "landing_page": ("transform your business", "increase conversions", "boost ROI")
         }
+        
+        self._meta_timeframes = ("minutes", "today", "this week", "quickly")
+        self._meta_ctas = ("Get started now", "Learn more", "Try it today", "Download free guide")
+        self._meta_adjectives = ("proven", "effective", "powerful", "simple")
+        
+    @staticmethod
+    def load_content_templates() -> Dict:
+        """Load content templates for different article types"""
+        return _CONTENT_TEMPLATES
     
-    def load_seo_patterns(self) -> Dict:
+    @staticmethod
+    def load_seo_patterns() -> Dict:
         """Load SEO optimization patterns"""
-        return {
-            "title_patterns": [
-                "{number} {adjective} Ways to {action} {keyword}",
-                "The Ultimate Guide to {keyword} in {year}",
-                "How to {action} {keyword}: {benefit}",
-                "{keyword}: Everything You Need to Know",
-                "{adjective} {keyword} Tips for {target_audience}",
-                "Why {keyword} is {adjective} for {context}",
-                "{keyword} vs {alternative}: Which is Better?"
-            ],
-            "heading_patterns": {
-                "h2": [
-                    "What is {keyword}?",
-                    "Benefits of {keyword}",
-                    "How to {action} {keyword}",
-                    "{keyword} Best Practices",
-                    "Common {keyword} Mistakes to Avoid",
-                    "{keyword} Tips and Tricks",
-                    "The Future of {keyword}"
-                ],
-                "h3": [
-                    "{specific_aspect} of {keyword}",
-                    "Step {number}: {action}",
-                    "{keyword} for {specific_use_case}",
-                    "Advanced {keyword} Techniques"
-                ]
-            },
-            "meta_patterns": [
-                "Learn {keyword} with our comprehensive guide. {benefit} in {timeframe}. {call_to_action}.",
-                "Discover {adjective} {keyword} strategies that {result}. Expert tips and {benefit}.",
-                "{keyword} made simple. {benefit} with proven methods. {call_to_action}.",
-                "Master {keyword} with this {adjective} guide. {benefit} and {additional_benefit}."
-            ]
-        }
+        return _SEO_PATTERNS
     
-    def generate_seo_article(self, source_content: Dict, seo_settings: Dict) -> Dict:
-        """Generate complete SEO-optimized article"""
+    def generate_seo_article(self, source_content: Dict, seo_settings: Dict,
+                             prompt_cache: Optional[PromptCache] = None, refresh: bool = False) -> Dict:
+        """Generate complete SEO-optimized article, reusing one from prompt_cache when available
+        
+        With refresh=True the cache is not consulted, so a fresh variation is generated;
+        it still replaces the cached article for these settings.
+        """
         try:
-            # Extract settings
-            primary_keyword = seo_settings.get('primary_keyword', '').strip()
-            secondary_keywords = seo_settings.get('secondary_keywords', [])
-            content_length = seo_settings.get('content_length', 800)
-            tone = seo_settings.get('tone', 'professional')
-            content_type = seo_settings.get('content_type', 'blog_post')
-            
-            if not primary_keyword:
-                return {"error": "Primary keyword is required for SEO optimization"}
+            cache_key = None
+            if prompt_cache is not None:
+                cache_key = prompt_cache.make_key(source_content, seo_settings)
+                if not refresh:
+                    cached = prompt_cache.get(cache_key)
+                    if cached is not None:
+                        return cached
+                    
+                    similar = prompt_cache.get_similar(cache_key)
+                    if similar is not None:
+                        refined = self.refine_cached_article(similar, seo_settings)
+                        prompt_cache.put(cache_key, refined)
+                        return refined
             
-            # Generate article components
-            article_title = self.generate_seo_title(primary_keyword, content_type, source_content)
-            meta_description = self.generate_meta_description(primary_keyword, content_type)
+            article = {}
+            for event in self.generate_seo_article_stream(source_content, seo_settings):
+                kind = event[0]
+                if kind == "error":
+                    return {"error": event[1]}
+                if kind in ("title", "meta", "content", "generated_at", "schema", "analysis", "word_count"):
+                    article[kind] = event[1]
             
-            # Generate structured content
-            article_sections = self.generate_article_sections(
-                source_content, primary_keyword, secondary_keywords, 
-                content_type, tone, content_length
-            )
-            
-            # Optimize content for SEO
-            optimized_content = self.optimize_content_for_seo(
-                article_sections, primary_keyword, secondary_keywords
-            )
-            
-            # Generate additional SEO elements
-            schema_markup = self.generate_schema_markup(article_title, meta_description, primary_keyword)
-            seo_analysis = self.analyze_seo_score(optimized_content, primary_keyword, secondary_keywords)
+            primary_keyword = seo_settings.get('primary_keyword', '').strip()
             
-            return {
-                "title": article_title,
-                "meta_description": meta_description,
-                "content": optimized_content,
-                "schema_markup": schema_markup,
-                "seo_analysis": seo_analysis,
-                "word_count": len(optimized_content.split()),
-                "generated_at": datetime.now().isoformat(),
+            result = {
+                "title": article["title"],
+                "meta_description": article["meta"],
+                "content": article["content"],
+                "schema_markup": article["schema"],
+                "seo_analysis": article["analysis"],
+                "word_count": article["word_count"],
+                "generated_at": article["generated_at"],
                 "settings_used": seo_settings,
                 "primary_keyword": primary_keyword,
-                "secondary_keywords": secondary_keywords
+                "secondary_keywords": seo_settings.get('secondary_keywords', [])
             }
             
+            if cache_key is not None:
+                prompt_cache.put(cache_key, result)
+            
         except Exception as e:
             return {"error": f"Error generating content: {str(e)}"}
+        
+        return result
+    
+    def refine_cached_article(self, article: Dict, seo_settings: Dict) -> Dict:
+        """Adapt a cached article generated for a similar keyword to the requested one
+        
+        Swaps the old primary keyword for the new one in the title, meta description
+        and body, then rebuilds the schema and rescores. The result is flagged with
+        from_generative_cache so the UI can say it was refined from a similar article.
+        """
+        primary_keyword = seo_settings.get('primary_keyword', '').strip()
+        secondary_keywords = seo_settings.get('secondary_keywords', [])
+        old_keyword = re.compile(rf"\b{re.escape(article['primary_keyword'])}\b", re.I)
+        
+        def swap(text: str) -> str:
+            return old_keyword.sub(lambda _: primary_keyword, text)
+        
+        title = swap(article["title"])
+        meta_description = swap(article["meta_description"])
+        content = swap(article["content"])
+        seo_analysis = self.analyze_seo_score(content, primary_keyword, secondary_keywords)
+        generated_at = datetime.now().isoformat()
+        
+        article.update({
+            "title": title,
+            "meta_description": meta_description,
+            "content": content,
+            "schema_markup": self.generate_schema_markup(
+                title, meta_description, primary_keyword, timestamp=generated_at
+            ),
+            "seo_analysis": seo_analysis,
+            "word_count": seo_analysis.get("word_count", 0),
+            "generated_at": generated_at,
+            "settings_used": seo_settings,
+            "primary_keyword": primary_keyword,
+            "secondary_keywords": secondary_keywords,
+            "from_generative_cache": True
+        })
+        return article
+    
+    def generate_seo_article_stream(self, source_content: Dict, seo_settings: Dict) -> Iterator[Tuple]:
+        """Generate an SEO-optimized article piece by piece
+        
+        Yields ("title", str), ("meta", str), ("introduction", str), one
+        ("section", heading, body) per main section, ("conclusion", str), then
+        ("content", str) with the keyword-optimized article body, ("generated_at", str),
+        ("schema", dict), ("analysis", dict) and ("word_count", int). Yields
+        ("error", str) and stops if the settings are unusable.
+        """
+        # Extract settings
+        primary_keyword = seo_settings.get('primary_keyword', '').strip()
+        secondary_keywords = seo_settings.get('secondary_keywords', [])
+        tone = seo_settings.get('tone', 'professional')
+        content_type = seo_settings.get('content_type', 'blog_post')
+        
+        if not primary_keyword:
+            yield ("error", "Primary keyword is required for SEO optimization")
+            return
+        
+        # Generate article components
+        article_title = self.generate_seo_title(primary_keyword, content_type, source_content)
+        yield ("title", article_title)
+        
+        meta_description = self.generate_meta_description(primary_keyword, content_type)
+        yield ("meta", meta_description)
+        
+        # Generate structured content, handing each section out as it is produced
+        source_text = source_content.get('content', '')
+        article_sections = {"main": []}
+        
+        article_sections["introduction"] = self.generate_introduction(
+            primary_keyword, source_text, content_type, tone
+        )
+        yield ("introduction", article_sections["introduction"])
+        
+        for section in self.iter_main_sections(
+            source_text, primary_keyword, secondary_keywords, content_type, tone
+        ):
+            article_sections["main"].append(section)
+            yield ("section", section["heading"], section["content"])
+        
+        article_sections["conclusion"] = self.generate_conclusion(
+            primary_keyword, content_type, tone
+        )
+        yield ("conclusion", article_sections["conclusion"])
+        
+        # Optimize content for SEO and score it from the same keyword scan
+        optimized_content, seo_analysis = self.optimize_and_score(
+            self.assemble_sections(article_sections), primary_keyword, secondary_keywords
+        )
+        del article_sections
+        yield ("content", optimized_content)
+        
+        # Generate additional SEO elements, stamped with a single clock read
+        generated_at = datetime.now().isoformat()
+        yield ("generated_at", generated_at)
+        yield ("schema", self.generate_schema_markup(
+            article_title, meta_description, primary_keyword, timestamp=generated_at
+        ))
+        yield ("analysis", seo_analysis)
+        yield ("word_count", seo_analysis.get("word_count", 0))
     
     def generate_seo_title(self, primary_keyword: str, content_type: str, source_content: Dict) -> str:
         """Generate SEO-optimized title"""
         templates = self.seo_patterns["title_patterns"]
         template = random.choice(templates)
+        number = random.randint(5, 15)
         
-        # Replace placeholders
-        title = template.replace("{keyword}", primary_keyword)
-        title = title.replace("{year}", str(datetime.now().year))
-        title = title.replace("{number}", str(random.randint(5, 15)))
-        
-        # Content type specific replacements
-        adjectives = {
-            "blog_post": ["Essential", "Proven", "Expert", "Complete", "Advanced"],
-            "review": ["Honest", "Detailed", "Comprehensive", "In-Depth", "Unbiased"],
-            "how_to_guide": ["Step-by-Step", "Complete", "Beginner's", "Ultimate", "Simple"],
-            "landing_page": ["Revolutionary", "Game-Changing", "Powerful", "Innovative", "Premium"]
-        }
-        
-        actions = {
-            "blog_post": ["Master", "Improve", "Optimize", "Boost", "Transform"],
-            "review": ["Choose", "Compare", "Evaluate", "Select", "Find"],
-            "how_to_guide": ["Learn", "Master", "Create", "Build", "Achieve"],
-            "landing_page": ["Transform", "Revolutionize", "Supercharge", "Optimize", "Enhance"]
-        }
-        
-        title = title.replace("{adjective}", random.choice(adjectives.get(content_type, adjectives["blog_post"])))
-        title = title.replace("{action}", random.choice(actions.get(content_type, actions["blog_post"])))
+        # Substitute every placeholder in a single pass over the template
+        title = _render_template(template, {
+            "keyword": primary_keyword,
+            "year": str(datetime.now().year),
+            "number": str(number),
+            "adjective": random.choice(self._title_adjectives.get(content_type, self._title_adjectives["blog_post"])),
+            "action": random.choice(self._title_actions.get(content_type, self._title_actions["blog_post"]))
+        })
         
         # Ensure title length is SEO-friendly (under 60 characters)
         if len(title) > 60:
@@ -201,25 +523,16 @@ class SEOContentGenerator:
         templates = self.seo_patterns["meta_patterns"]
         template = random.choice(templates)
         
-        # Replace placeholders
-        meta = template.replace("{keyword}", primary_keyword)
-        
-        benefits = {
-            "blog_post": ["increase engagement", "boost performance", "improve results"],
-            "review": ["make informed decisions", "save time and money", "choose the best option"],
-            "how_to_guide": ["get started quickly", "avoid common mistakes", "achieve better results"],
-            "landing_page": ["transform your business", "increase conversions", "boost ROI"]
-        }
-        
-        timeframes = ["minutes", "today", "this week", "quickly"]
-        ctas = ["Get started now", "Learn more", "Try it today", "Download free guide"]
-        
-        meta = meta.replace("{benefit}", random.choice(benefits.get(content_type, benefits["blog_post"])))
-        meta = meta.replace("{timeframe}", random.choice(timeframes))
-        meta = meta.replace("{call_to_action}", random.choice(ctas))
-        meta = meta.replace("{adjective}", random.choice(["proven", "effective", "powerful", "simple"]))
-        meta = meta.replace("{result}", "deliver real results")
-        meta = meta.replace("{additional_benefit}", "save time")
+        # Substitute every placeholder in a single pass over the template
+        meta = _render_template(template, {
+            "keyword": primary_keyword,
+            "benefit": random.choice(self._meta_benefits.get(content_type, self._meta_benefits["blog_post"])),
+            "timeframe": random.choice(self._meta_timeframes),
+            "call_to_action": random.choice(self._meta_ctas),
+            "adjective": random.choice(self._meta_adjectives),
+            "result": "deliver real results",
+            "additional_benefit": "save time"
+        })
         
         # Ensure meta description is under 160 characters
         if len(meta) > 160:
@@ -227,166 +540,131 @@ class SEOContentGenerator:
         
         return meta
     
-    def generate_article_sections(self, source_content: Dict, primary_keyword: str, 
-                                secondary_keywords: List[str], content_type: str, 
-                                tone: str, target_length: int) -> Dict:
-        """Generate structured article sections"""
-        
-        template = self.content_templates.get(content_type, self.content_templates["blog_post"])
-        source_text = source_content.get('content', '')
-        
-        sections = {}
-        
-        # Introduction
-        sections["introduction"] = self.generate_introduction(
-            primary_keyword, source_text, content_type, tone
-        )
-        
-        # Main content sections
-        main_sections = self.generate_main_sections(
-            source_text, primary_keyword, secondary_keywords, content_type, tone
-        )
-        sections.update(main_sections)
-        
-        # Conclusion
-        sections["conclusion"] = self.generate_conclusion(
-            primary_keyword, content_type, tone
-        )
-        
-        return sections
-    
     def generate_introduction(self, primary_keyword: str, source_text: str, 
                             content_type: str, tone: str) -> str:
         """Generate engaging introduction"""
         
-        template = self.content_templates[content_type]
-        hooks = template.get("intro_hooks", [])
-        hook = random.choice(hooks)
-        
-        # Replace placeholders in hook
-        hook = hook.replace("{Primary_keyword}", primary_keyword.title())
-        hook = hook.replace("{main_topic}", primary_keyword)
+        # Render a randomly chosen, pre-specialized hook
+        hook = random.choice(self._intro_renderers[content_type])(primary_keyword)
         
         # Generate introduction paragraph
-        intro_content = f"{hook}\n\n"
+        parts = [f"{hook}\n\n"]
         
         if source_text:
             # Extract key points from source
-            sentences = source_text.split('.')[:3]
+            sentences = _source_sentences(source_text)[:3]
             key_points = [s.strip() for s in sentences if len(s.strip()) > 20]
             
             if key_points:
-                intro_content += f"In this comprehensive guide, we'll explore {primary_keyword} and discover how it can transform your approach. "
-                intro_content += f"You'll learn practical strategies, expert tips, and actionable insights to master {primary_keyword}.\n\n"
+                parts.append(f"In this comprehensive guide, we'll explore {primary_keyword} and discover how it can transform your approach. ")
+                parts.append(f"You'll learn practical strategies, expert tips, and actionable insights to master {primary_keyword}.\n\n")
         else:
-            intro_content += f"Understanding {primary_keyword} is crucial in today's competitive landscape. "
-            intro_content += f"This guide will provide you with everything you need to know about {primary_keyword}, "
-            intro_content += f"from basic concepts to advanced strategies.\n\n"
+            parts.append(f"Understanding {primary_keyword} is crucial in today's competitive landscape. ")
+            parts.append(f"This guide will provide you with everything you need to know about {primary_keyword}, ")
+            parts.append(f"from basic concepts to advanced strategies.\n\n")
         
-        intro_content += f"Whether you're just getting started or looking to improve your existing {primary_keyword} approach, "
-        intro_content += f"this article has something valuable for you. Let's dive in!"
+        parts.append(f"Whether you're just getting started or looking to improve your existing {primary_keyword} approach, ")
+        parts.append(f"this article has something valuable for you. Let's dive in!")
         
-        return intro_content
+        return ''.join(parts)
     
-    def generate_main_sections(self, source_text: str, primary_keyword: str, 
-                             secondary_keywords: List[str], content_type: str, tone: str) -> Dict:
-        """Generate main content sections"""
-        
-        sections = {}
+    def iter_main_sections(self, source_text: str, primary_keyword: str,
+                           secondary_keywords: List[str], content_type: str, tone: str) -> Iterator[Dict]:
+        """Yield main content sections one at a time, in article order"""
         
         # Generate H2 headings
         h2_patterns = self.seo_patterns["heading_patterns"]["h2"]
+        keyword_title = primary_keyword.title()
         
         # Section 1: What is [keyword]
-        heading1 = h2_patterns[0].replace("{keyword}", primary_keyword.title())
-        sections[f"section_1"] = {
+        heading1 = h2_patterns[0].replace("{keyword}", keyword_title)
+        yield {
             "heading": heading1,
             "content": self.generate_definition_section(primary_keyword, source_text, tone)
         }
         
         # Section 2: Benefits
-        heading2 = h2_patterns[1].replace("{keyword}", primary_keyword.title())
-        sections[f"section_2"] = {
+        heading2 = h2_patterns[1].replace("{keyword}", keyword_title)
+        yield {
             "heading": heading2,
             "content": self.generate_benefits_section(primary_keyword, secondary_keywords, tone)
         }
         
         # Section 3: How-to
-        heading3 = h2_patterns[2].replace("{keyword}", primary_keyword)
-        heading3 = heading3.replace("{action}", "implement")
-        sections[f"section_3"] = {
+        heading3 = _render_template(h2_patterns[2], {"keyword": primary_keyword, "action": "implement"})
+        yield {
             "heading": heading3,
             "content": self.generate_howto_section(primary_keyword, source_text, tone)
         }
         
         # Section 4: Best Practices
-        heading4 = h2_patterns[3].replace("{keyword}", primary_keyword.title())
-        sections[f"section_4"] = {
+        heading4 = h2_patterns[3].replace("{keyword}", keyword_title)
+        yield {
             "heading": heading4,
             "content": self.generate_best_practices_section(primary_keyword, secondary_keywords, tone)
         }
-        
-        return sections
     
     def generate_definition_section(self, primary_keyword: str, source_text: str, tone: str) -> str:
         """Generate definition/overview section"""
-        content = f"{primary_keyword.title()} refers to the strategic approach of optimizing and implementing "
-        content += f"{primary_keyword} to achieve better results and improved performance.\n\n"
+        parts = [f"{primary_keyword.title()} refers to the strategic approach of optimizing and implementing "]
+        parts.append(f"{primary_keyword} to achieve better results and improved performance.\n\n")
         
         if source_text:
             # Extract relevant sentences from source
-            sentences = source_text.split('.')
-            relevant_sentences = [s.strip() for s in sentences if primary_keyword.lower() in s.lower()][:2]
+            sentences = _source_sentences(source_text)
+            keyword_lower = primary_keyword.lower()
+            relevant_sentences = [s.strip() for s in sentences if keyword_lower in s.lower()][:2]
             
             if relevant_sentences:
-                content += "Key characteristics include:\n\n"
+                parts.append("Key characteristics include:\n\n")
                 for sentence in relevant_sentences:
                     if len(sentence.strip()) > 20:
-                        content += f"• {sentence.strip()}.\n"
+                        parts.append(f"• {sentence.strip()}.\n")
         else:
-            content += f"The core principles of effective {primary_keyword} include strategic planning, "
-            content += f"consistent implementation, and continuous optimization for best results.\n\n"
+            parts.append(f"The core principles of effective {primary_keyword} include strategic planning, ")
+            parts.append(f"consistent implementation, and continuous optimization for best results.\n\n")
         
-        content += f"\nUnderstanding these fundamentals is essential for anyone looking to leverage "
-        content += f"{primary_keyword} effectively in their strategy."
+        parts.append(f"\nUnderstanding these fundamentals is essential for anyone looking to leverage ")
+        parts.append(f"{primary_keyword} effectively in their strategy.")
         
-        return content
+        return ''.join(parts)
     
     def generate_benefits_section(self, primary_keyword: str, secondary_keywords: List[str], tone: str) -> str:
         """Generate benefits section"""
         benefits = [
-            f"Improved efficiency and performance in {primary_keyword} implementation",
-            f"Better results through strategic {primary_keyword} optimization",
-            f"Increased ROI and measurable outcomes",
-            f"Enhanced competitive advantage in your market",
-            f"Sustainable long-term growth and success"
+            "Improved efficiency and performance in {kw} implementation",
+            "Better results through strategic {kw} optimization",
+            "Increased ROI and measurable outcomes",
+            "Enhanced competitive advantage in your market",
+            "Sustainable long-term growth and success"
         ]
+        keyword_forms = {"kw": primary_keyword, "Kw": primary_keyword.title()}
         
-        content = f"Implementing effective {primary_keyword} strategies offers numerous advantages:\n\n"
+        parts = [f"Implementing effective {primary_keyword} strategies offers numerous advantages:\n\n"]
         
         for i, benefit in enumerate(benefits[:4], 1):
-            content += f"**{i}. {benefit.split(primary_keyword)[0].strip().title()}{primary_keyword}{benefit.split(primary_keyword)[1] if primary_keyword in benefit else benefit}**\n"
+            parts.append(f"**{i}. {benefit.format_map(keyword_forms)}**\n")
             
             # Add explanation
             if i == 1:
-                content += f"When you optimize your {primary_keyword} approach, you'll see immediate improvements in efficiency and effectiveness.\n\n"
+                parts.append(f"When you optimize your {primary_keyword} approach, you'll see immediate improvements in efficiency and effectiveness.\n\n")
             elif i == 2:
-                content += f"Strategic {primary_keyword} implementation leads to measurable improvements in key performance indicators.\n\n"
+                parts.append(f"Strategic {primary_keyword} implementation leads to measurable improvements in key performance indicators.\n\n")
             elif i == 3:
-                content += f"Proper {primary_keyword} strategies provide clear return on investment through improved outcomes.\n\n"
+                parts.append(f"Proper {primary_keyword} strategies provide clear return on investment through improved outcomes.\n\n")
             elif i == 4:
-                content += f"Stay ahead of competitors by leveraging advanced {primary_keyword} techniques and best practices.\n\n"
+                parts.append(f"Stay ahead of competitors by leveraging advanced {primary_keyword} techniques and best practices.\n\n")
         
         # Include secondary keywords if available
         if secondary_keywords:
-            content += f"Additionally, integrating {', '.join(secondary_keywords[:2])} with your {primary_keyword} "
-            content += f"strategy can amplify these benefits and create synergistic effects."
+            parts.append(f"Additionally, integrating {', '.join(secondary_keywords[:2])} with your {primary_keyword} ")
+            parts.append(f"strategy can amplify these benefits and create synergistic effects.")
         
-        return content
+        return ''.join(parts)
     
     def generate_howto_section(self, primary_keyword: str, source_text: str, tone: str) -> str:
         """Generate how-to section"""
-        content = f"Here's a step-by-step approach to implementing {primary_keyword} effectively:\n\n"
+        parts = [f"Here's a step-by-step approach to implementing {primary_keyword} effectively:\n\n"]
         
         steps = [
             f"**Step 1: Plan Your {primary_keyword.title()} Strategy**\n"
@@ -402,13 +680,13 @@ class SEOContentGenerator:
             f"Once you've achieved success with basic {primary_keyword} implementation, expand to more advanced strategies.\n\n"
         ]
         
-        content += ''.join(steps)
+        parts.extend(steps)
         
         if source_text and len(source_text) > 200:
-            content += f"\n**Pro Tip:** Based on industry insights, successful {primary_keyword} implementation "
-            content += f"requires consistent effort and regular optimization to maintain peak performance."
+            parts.append(f"\n**Pro Tip:** Based on industry insights, successful {primary_keyword} implementation ")
+            parts.append(f"requires consistent effort and regular optimization to maintain peak performance.")
         
-        return content
+        return ''.join(parts)
     
     def generate_best_practices_section(self, primary_keyword: str, secondary_keywords: List[str], tone: str) -> str:
         """Generate best practices section"""
@@ -420,139 +698,155 @@ class SEOContentGenerator:
             f"Test and iterate different {primary_keyword} methods to find what works best"
         ]
         
-        content = f"Follow these essential {primary_keyword} best practices for optimal results:\n\n"
+        parts = [f"Follow these essential {primary_keyword} best practices for optimal results:\n\n"]
         
         for i, practice in enumerate(practices, 1):
-            content += f"**{i}. {practice.title()}**\n"
+            parts.append(f"**{i}. {practice.title()}**\n")
             
             if i == 1:
-                content += f"Clear objectives ensure your {primary_keyword} efforts are focused and measurable.\n\n"
+                parts.append(f"Clear objectives ensure your {primary_keyword} efforts are focused and measurable.\n\n")
             elif i == 2:
-                content += f"Data-driven insights help you optimize your {primary_keyword} performance continuously.\n\n"
+                parts.append(f"Data-driven insights help you optimize your {primary_keyword} performance continuously.\n\n")
             elif i == 3:
-                content += f"Staying current with {primary_keyword} innovations keeps you competitive.\n\n"
+                parts.append(f"Staying current with {primary_keyword} innovations keeps you competitive.\n\n")
             elif i == 4:
-                content += f"Quality {primary_keyword} implementation delivers better long-term results.\n\n"
+                parts.append(f"Quality {primary_keyword} implementation delivers better long-term results.\n\n")
             elif i == 5:
-                content += f"Continuous testing helps you discover the most effective {primary_keyword} strategies.\n\n"
+                parts.append(f"Continuous testing helps you discover the most effective {primary_keyword} strategies.\n\n")
         
         if secondary_keywords:
-            content += f"**Remember:** Integrating {', '.join(secondary_keywords[:2])} with your {primary_keyword} "
-            content += f"strategy can significantly enhance overall effectiveness and results."
+            parts.append(f"**Remember:** Integrating {', '.join(secondary_keywords[:2])} with your {primary_keyword} ")
+            parts.append(f"strategy can significantly enhance overall effectiveness and results.")
         
-        return content
+        return ''.join(parts)
     
     def generate_conclusion(self, primary_keyword: str, content_type: str, tone: str) -> str:
         """Generate compelling conclusion"""
-        content = f"Mastering {primary_keyword} is essential for achieving outstanding results in today's competitive environment. "
-        content += f"By implementing the strategies and best practices outlined in this guide, you'll be well-equipped to "
-        content += f"leverage {primary_keyword} effectively and achieve your goals.\n\n"
+        buffer = io.StringIO()
+        self.write_conclusion(buffer, primary_keyword, content_type, tone)
+        return buffer.getvalue()
+    
+    def write_conclusion(self, sink: TextIO, primary_keyword: str, content_type: str, tone: str) -> None:
+        """Write the conclusion straight to a text sink such as a file or StringIO"""
+        sink.write(f"Mastering {primary_keyword} is essential for achieving outstanding results in today's competitive environment. ")
+        sink.write(f"By implementing the strategies and best practices outlined in this guide, you'll be well-equipped to ")
+        sink.write(f"leverage {primary_keyword} effectively and achieve your goals.\n\n")
         
-        content += f"Remember, successful {primary_keyword} implementation requires consistency, patience, and continuous learning. "
-        content += f"Start with the fundamentals, track your progress, and gradually implement more advanced techniques "
-        content += f"as you gain experience.\n\n"
+        sink.write(f"Remember, successful {primary_keyword} implementation requires consistency, patience, and continuous learning. ")
+        sink.write(f"Start with the fundamentals, track your progress, and gradually implement more advanced techniques ")
+        sink.write(f"as you gain experience.\n\n")
         
         # Call to action based on content type
         if content_type == "blog_post":
-            content += f"Ready to take your {primary_keyword} strategy to the next level? Start implementing these techniques today "
-            content += f"and watch your results improve. Share your experience in the comments below!"
+            sink.write(f"Ready to take your {primary_keyword} strategy to the next level? Start implementing these techniques today ")
+            sink.write(f"and watch your results improve. Share your experience in the comments below!")
         elif content_type == "how_to_guide":
-            content += f"Now you have all the tools needed to succeed with {primary_keyword}. Follow the steps outlined above, "
-            content += f"stay consistent, and you'll see significant improvements in your results."
+            sink.write(f"Now you have all the tools needed to succeed with {primary_keyword}. Follow the steps outlined above, ")
+            sink.write(f"stay consistent, and you'll see significant improvements in your results.")
         elif content_type == "review":
-            content += f"Based on our comprehensive analysis, {primary_keyword} offers significant value when implemented correctly. "
-            content += f"Consider your specific needs and choose the approach that best aligns with your objectives."
+            sink.write(f"Based on our comprehensive analysis, {primary_keyword} offers significant value when implemented correctly. ")
+            sink.write(f"Consider your specific needs and choose the approach that best aligns with your objectives.")
         else:
-            content += f"Take action today and transform your {primary_keyword} approach. The strategies in this guide "
-            content += f"have helped countless others achieve success - now it's your turn."
-        
-        return content
+            sink.write(f"Take action today and transform your {primary_keyword} approach. The strategies in this guide ")
+            sink.write(f"have helped countless others achieve success - now it's your turn.")
     
-    def optimize_content_for_seo(self, sections: Dict, primary_keyword: str, secondary_keywords: List[str]) -> str:
-        """Combine and optimize all sections for SEO"""
-        content = ""
-        
+    def assemble_sections(self, sections: Dict) -> str:
+        """Join introduction, main sections and conclusion into markdown"""
         # Add introduction
-        content += sections.get("introduction", "") + "\n\n"
+        parts = [sections.get("introduction", ""), "\n\n"]
         
         # Add main sections with headings
-        section_keys = [key for key in sections.keys() if key.startswith("section_")]
-        for key in sorted(section_keys):
-            section = sections[key]
-            if isinstance(section, dict):
-                content += f"## {section.get('heading', '')}\n\n"
-                content += section.get('content', '') + "\n\n"
-            else:
-                content += section + "\n\n"
+        for section in sections.get("main", []):
+            parts.append(f"## {section.get('heading', '')}\n\n")
+            parts.append(section.get('content', ''))
+            parts.append("\n\n")
         
         # Add conclusion
-        content += "## Conclusion\n\n"
-        content += sections.get("conclusion", "") + "\n\n"
-        
-        # Optimize keyword density
-        content = self.optimize_keyword_density(content, primary_keyword, secondary_keywords)
+        parts.append("## Conclusion\n\n")
+        parts.append(sections.get("conclusion", ""))
+        parts.append("\n\n")
+        
+        return ''.join(parts)
+    
+    def optimize_and_score(self, content: str, primary_keyword: str,
+                           secondary_keywords: List[str]) -> Tuple[str, Dict]:
+        """Optimize keyword density and score the result
+        
+        Keyword variations are woven in when the primary keyword is underused. The
+        article is word-counted and keyword-scanned once; inserted variation sentences
+        update the counts incrementally instead of rescanning. The word total is reused
+        for scoring, but the keyword counts only reach analyze_seo_score_basic: when
+        SEOAnalyzer is available it runs its own keyword analysis over the content.
+        """
+        total_words = _count_words(content)
+        tracked_keywords = [primary_keyword, *secondary_keywords, *_keyword_variations(primary_keyword)]
+        keyword_counts = _count_keywords(content.lower(), tracked_keywords)
+        
+        if total_words:
+            content, total_words = self._insert_keyword_variations(
+                content, primary_keyword, total_words, keyword_counts, tracked_keywords
+            )
+        content = content.strip()
         
-        return content.strip()
+        analysis = self.analyze_seo_score(
+            content, primary_keyword, secondary_keywords,
+            total_words=total_words, keyword_counts=keyword_counts
+        )
+        return content, analysis
     
-    def optimize_keyword_density(self, content: str, primary_keyword: str, secondary_keywords: List[str]) -> str:
-        """Optimize keyword density for SEO"""
-        # Target keyword density: 1-2% for primary, 0.5-1% for secondary
-        words = content.split()
-        total_words = len(words)
-        
-        if total_words == 0:
-            return content
+    def _insert_keyword_variations(self, content: str, primary_keyword: str, total_words: int,
+                                   keyword_counts: Counter, tracked_keywords: List[str]) -> Tuple[str, int]:
+        """Weave keyword variations into the middle paragraph when primary density is low
         
-        # Count current keyword occurrences
-        primary_count = content.lower().count(primary_keyword.lower())
-        primary_density = (primary_count / total_words) * 100
+        keyword_counts must hold counts for the primary keyword and its variations;
+        it is updated in place for every tracked keyword in each inserted sentence.
+        Returns the new content and word total.
+        """
+        primary_density = (keyword_counts[primary_keyword.lower()] / total_words) * 100
         
         # If density is too low, add keyword variations
         if primary_density < 1.0:
-            # Add keyword variations naturally
-            variations = [
-                f"effective {primary_keyword}",
-                f"{primary_keyword} strategies",
-                f"successful {primary_keyword}",
-                f"{primary_keyword} implementation"
-            ]
-            
             # Insert variations naturally (this is a simplified approach)
-            for variation in variations[:2]:
-                if variation.lower() not in content.lower():
+            for variation in _keyword_variations(primary_keyword):
+                if keyword_counts[variation.lower()] == 0:
                     # Find a good place to insert (after a paragraph)
                     paragraphs = content.split('\n\n')
                     if len(paragraphs) > 2:
                         insert_point = len(paragraphs) // 2
-                        paragraphs[insert_point] += f" When it comes to {variation}, consistency is key."
+                        sentence = f" When it comes to {variation}, consistency is key."
+                        paragraphs[insert_point] += sentence
                         content = '\n\n'.join(paragraphs)
+                        keyword_counts.update(_count_keywords(sentence.lower(), tracked_keywords))
+                        total_words += _count_words(sentence)
         
-        return content
+        return content, total_words
     
-    def generate_schema_markup(self, title: str, description: str, keyword: str) -> Dict:
+    def generate_schema_markup(self, title: str, description: str, keyword: str,
+                               timestamp: Optional[str] = None) -> Dict:
         """Generate JSON-LD schema markup for SEO"""
-        schema = {
-            "@context": "https://schema.org",
-            "@type": "Article",
-            "headline": title,
-            "description": description,
-            "keywords": keyword,
-            "author": {
-                "@type": "Organization",
-                "name": "SEO Content Generator"
-            },
-            "publisher": {
-                "@type": "Organization",
-                "name": "SEO Content Generator"
-            },
-            "datePublished": datetime.now().isoformat(),
-            "dateModified": datetime.now().isoformat()
-        }
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+        
+        # Copy the cached base so per-call values never leak into the cache
+        schema = dict(_schema_markup_base(title, description, keyword))
+        schema["author"] = {"@type": "Organization", "name": "SEO Content Generator"}
+        schema["publisher"] = {"@type": "Organization", "name": "SEO Content Generator"}
+        schema["datePublished"] = timestamp
+        schema["dateModified"] = timestamp
         
         return schema
     
-    def analyze_seo_score(self, content: str, primary_keyword: str, secondary_keywords: List[str]) -> Dict:
-        """Analyze SEO score of generated content with enhanced analysis"""
+    def analyze_seo_score(self, content: str, primary_keyword: str, secondary_keywords: List[str],
+                          content_lower: Optional[str] = None, total_words: Optional[int] = None,
+                          keyword_counts: Optional[Counter] = None) -> Dict:
+        """Analyze SEO score of generated content with enhanced analysis
+        
+        content_lower and keyword_counts are precomputed inputs for the basic scorer;
+        SEOAnalyzer takes only the content and does its own scan.
+        """
+        if total_words is None:
+            total_words = _count_words(content)
+        
         # Import the enhanced SEO analyzer
         try:
             from seo_analyzer import SEOAnalyzer
@@ -594,8 +888,8 @@ class SEOContentGenerator:
             return {
                 'score': overall_score,
                 'keyword_density': keyword_density,
-                'word_count': len(content.split()),
-                'h2_count': content.count('## '),
+                'word_count': total_words,
+                'h2_count': len(_H2_RE.findall(content)),
                 'issues': issues,
                 'recommendations': recommendations,
                 'grade': grade,
@@ -604,23 +898,35 @@ class SEOContentGenerator:
             
         except ImportError:
             # Fallback to basic analysis if enhanced analyzer not available
-            return self.analyze_seo_score_basic(content, primary_keyword, secondary_keywords)
+            return self.analyze_seo_score_basic(
+                content, primary_keyword, secondary_keywords,
+                content_lower=content_lower, total_words=total_words, keyword_counts=keyword_counts
+            )
     
-    def analyze_seo_score_basic(self, content: str, primary_keyword: str, secondary_keywords: List[str]) -> Dict:
+    def analyze_seo_score_basic(self, content: str, primary_keyword: str, secondary_keywords: List[str],
+                                content_lower: Optional[str] = None, total_words: Optional[int] = None,
+                                keyword_counts: Optional[Counter] = None) -> Dict:
         """Basic SEO analysis as fallback"""
-        words = content.split()
-        total_words = len(words)
+        if total_words is None:
+            total_words = _count_words(content)
         
         if total_words == 0:
-            return {"score": 0, "issues": ["No content to analyze"]}
+            return {"score": 0, "word_count": 0, "issues": ["No content to analyze"]}
         
         score = 0
         max_score = 100
         issues = []
         recommendations = []
         
+        # Count primary and secondary keywords in one pass, unless the caller already did
+        primary_lower = primary_keyword.lower()
+        if keyword_counts is None:
+            if content_lower is None:
+                content_lower = content.lower()
+            keyword_counts = _count_keywords(content_lower, [primary_keyword, *secondary_keywords])
+        
         # Keyword density check
-        primary_count = content.lower().count(primary_keyword.lower())
+        primary_count = keyword_counts[primary_lower]
         primary_density = (primary_count / total_words) * 100
         
         if 1.0 <= primary_density <= 2.0:
@@ -645,7 +951,7 @@ class SEOContentGenerator:
             score += 15
         
         # Heading structure check
-        h2_count = content.count('## ')
+        period_count, h2_count = content.count('.'), len(_H2_RE.findall(content))
         if h2_count >= 3:
             score += 15
         elif h2_count >= 2:
@@ -655,8 +961,7 @@ class SEOContentGenerator:
             recommendations.append("Include 3-5 H2 headings for optimal structure")
         
         # Keyword in headings check
-        headings = re.findall(r'## (.+)', content)
-        keyword_in_headings = any(primary_keyword.lower() in heading.lower() for heading in headings)
+        keyword_in_headings = any(primary_lower in heading.lower() for heading in _HEADING_RE.findall(content))
         
         if keyword_in_headings:
             score += 15
@@ -666,7 +971,7 @@ class SEOContentGenerator:
         
         # Secondary keywords check
         if secondary_keywords:
-            secondary_found = sum(1 for kw in secondary_keywords if kw.lower() in content.lower())
+            secondary_found = sum(1 for kw in secondary_keywords if keyword_counts[kw.lower()] > 0)
             if secondary_found > 0:
                 score += 10
             else:
@@ -674,7 +979,7 @@ class SEOContentGenerator:
                 recommendations.append("Include secondary keywords naturally in content")
         
         # Readability check (simplified)
-        avg_sentence_length = total_words / max(content.count('.'), 1)
+        avg_sentence_length = total_words / max(period_count, 1)
         if avg_sentence_length <= 20:
             score += 10
         else:
@@ -694,975 +999,7 @@ class SEOContentGenerator:
             "grade": self.get_seo_grade(final_score)
         }
     
-    def get_seo_grade(self, score: int) -> str:
-        """Convert SEO score to letter grade"""
-        if score >= 90:
-            return "A+"
-        elif score >= 80:
-            return "A"
-        elif score >= 70:
-            return "B"
-        elif score >= 60:
-            return "C"
-        elif score >= 50:
-            return "D"
-        else:
-            return "F"
-
-def render_content_generation_interface():
-    """Render the content generation interface"""
-    st.markdown("## 🚀 Generate SEO Content")
-    
-    # Check if we have content to work with
-    if 'current_content' not in st.session_state or not st.session_state.current_content:
-        st.warning("⚠️ No content detected. Please extract content first using the Content Input section.")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("📥 Go to Content Input", type="primary"):
-                st.session_state.current_page = "content_input"
-                st.rerun()
-        
-        with col2:
-            if st.button("⚙️ Configure SEO Settings", type="secondary"):
-                st.session_state.current_page = "seo_settings"
-                st.rerun()
-        
-        return
-    
-    # Display source content summary
-    content_data = st.session_state.current_content
-    
-    with st.expander("📋 Source Content Summary", expanded=False):
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("📝 Words", content_data.get('word_count', 0))
-        with col2:
-            st.metric("⏱️ Read Time", f"{content_data.get('reading_time', 0)} min")
-        with col3:
-            st.metric("📰 Title", "✅" if content_data.get('title') else "❌")
-        
-        if content_data.get('title'):
-            st.markdown(f"**Title:** {content_data['title']}")
-        
-        preview = content_data.get('content', '')[:200] + "..." if len(content_data.get('content', '')) > 200 else content_data.get('content', '')
-        st.markdown(f"**Preview:** {preview}")
-    
-    # SEO Settings Quick Config
-    st.markdown("### ⚙️ SEO Configuration")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        primary_keyword = st.text_input(
-            "🎯 Primary Keyword *",
-            value=st.session_state.seo_settings.get('primary_keyword', ''),
-            placeholder="Enter main keyword to optimize for",
-            help="The main keyword you want to rank for"
-        )
-        
-        content_length = st.slider(
-            "📏 Target Word Count",
-            min_value=300,
-            max_value=3000,
-            value=st.session_state.seo_settings.get('content_length', 800),
-            step=100,
-            help="Target length for the generated article"
-        )
-    
-    with col2:
-        secondary_keywords = st.text_area(
-            "🔍 Secondary Keywords",
-            value='\n'.join(st.session_state.seo_settings.get('secondary_keywords', [])),
-            placeholder="Enter one keyword per line\nrelated keyword 1\nrelated keyword 2",
-            height=80,
-            help="Related keywords to include naturally"
-        )
-        
-        tone = st.selectbox(
-            "🎭 Content Tone",
-            ["professional", "conversational", "authoritative", "friendly", "technical"],
-            index=["professional", "conversational", "authoritative", "friendly", "technical"].index(
-                st.session_state.seo_settings.get('tone', 'professional')
-            ),
-            help="Writing style for the generated content"
-        )
-    
-    # Content type selection
-    content_type = st.selectbox(
-        "📄 Content Type",
-        ["blog_post", "how_to_guide", "review", "landing_page"],
-        format_func=lambda x: {
-            "blog_post": "📝 Blog Post",
-            "how_to_guide": "📋 How-To Guide", 
-            "review": "⭐ Review Article",
-            "landing_page": "🎯 Landing Page"
-        }[x],
-        index=["blog_post", "how_to_guide", "review", "landing_page"].index(
-            st.session_state.seo_settings.get('content_type', 'blog_post')
-        ),
-        help="Type of content to generate"
-    )
-    
-    # Update session state
-    secondary_keywords_list = [kw.strip() for kw in secondary_keywords.split('\n') if kw.strip()]
-    
-    st.session_state.seo_settings.update({
-        'primary_keyword': primary_keyword,
-        'secondary_keywords': secondary_keywords_list,
-        'content_length': content_length,
-        'tone': tone,
-        'content_type': content_type
-    })
-    
-    # Generation controls
-    st.markdown("---")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("🚀 Generate Article", type="primary", disabled=not primary_keyword):
-            generate_article_content()
-    
-    with col2:
-        if st.button("⚙️ Advanced Settings"):
-            st.session_state.current_page = "seo_settings" 
-            st.rerun()
-    
-    with col3:
-        if st.button("🔄 Reset Settings"):
-            st.session_state.seo_settings = {
-                'primary_keyword': '',
-                'secondary_keywords': [],
-                'content_length': 800,
-                'tone': 'professional',
-                'content_type': 'blog_post'
-            }
-            st.rerun()
-    
-    # Display generated content if available
-    if 'generated_article' in st.session_state and st.session_state.generated_article:
-        display_generated_article()
-
-def generate_article_content():
-    """Generate the SEO-optimized article"""
-    try:
-        # Initialize generator
-        if 'seo_generator' not in st.session_state:
-            st.session_state.seo_generator = SEOContentGenerator()
-        
-        # Show progress
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        status_text.text("🔄 Initializing content generation...")
-        progress_bar.progress(20)
-        
-        status_text.text("📝 Generating article structure...")
-        progress_bar.progress(40)
-        
-        # Generate content
-        generator = st.session_state.seo_generator
-        source_content = st.session_state.current_content
-        seo_settings = st.session_state.seo_settings
-        
-        status_text.text("🎯 Optimizing for SEO...")
-        progress_bar.progress(60)
-        
-        result = generator.generate_seo_article(source_content, seo_settings)
-        
-        status_text.text("📊 Analyzing SEO score...")
-        progress_bar.progress(80)
-        
-        if "error" in result:
-            st.error(f"❌ {result['error']}")
-            progress_bar.empty()
-            status_text.empty()
-            return
-        
-        # Store generated content
-        st.session_state.generated_article = result
-        
-        # Update user stats
-        if st.session_state.authenticated and 'auth_manager' in st.session_state:
-            st.session_state.auth_manager.update_user_stats(
-                st.session_state.username, 
-                content_generated=True
-            )
-        
-        progress_bar.progress(100)
-        status_text.text("✅ Article generated successfully!")
-        
-        # Clear progress indicators
-        import time
-        time.sleep(1)
-        progress_bar.empty()
-        status_text.empty()
-        
-        st.success("🎉 SEO-optimized article generated successfully!")
-        st.rerun()
-        
-    except Exception as e:
-        st.error(f"❌ Error generating content: {str(e)}")
-
-def display_generated_article():
-    """Display the generated article with options to edit and download"""
-    st.markdown("---")
-    st.markdown("## 📄 Generated Article")
-    
-    article_data = st.session_state.generated_article
-    
-    # SEO Score Display
-    seo_analysis = article_data.get('seo_analysis', {})
-    score = seo_analysis.get('score', 0)
-    grade = seo_analysis.get('grade', 'F')
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        score_color = "🟢" if score >= 80 else "🟡" if score >= 60 else "🔴"
-        st.metric("SEO Score", f"{score_color} {score}/100")
-    
-    with col2:
-        st.metric("Grade", f"📊 {grade}")
-    
-    with col3:
-        st.metric("Word Count", f"📝 {article_data.get('word_count', 0)}")
-    
-    with col4:
-        keyword_density = seo_analysis.get('keyword_density', 0)
-        st.metric("Keyword Density", f"🎯 {keyword_density:.1f}%")
-    
-    # Enhanced SEO Analysis Button
-    if st.button("📊 Advanced SEO Analysis", type="secondary"):
-        # Check if enhanced analysis is available
-        detailed_analysis = seo_analysis.get('detailed_analysis')
-        if detailed_analysis:
-            st.session_state.current_seo_analysis = detailed_analysis
-            st.session_state.current_page = "seo_analysis"
-            st.rerun()
-        else:
-            st.info("💡 Enhanced SEO analysis will be available when the advanced analyzer is integrated")
-    
-    # Article content tabs
-    tab1, tab2, tab3, tab4 = st.tabs(["📄 Article", "✏️ Edit", "📊 SEO Analysis", "💾 Export"])
-    
-    with tab1:
-        display_article_preview(article_data)
-    
-    with tab2:
-        display_article_editor(article_data)
-    
-    with tab3:
-        display_seo_analysis(seo_analysis)
-    
-    with tab4:
-        display_export_options(article_data)
-
-def display_article_preview(article_data):
-    """Display article preview"""
-    st.markdown("### 📰 Article Preview")
-    
-    # Title
-    st.markdown(f"# {article_data.get('title', 'Untitled')}")
-    
-    # Meta description
-    if article_data.get('meta_description'):
-        with st.expander("📝 Meta Description"):
-            st.write(article_data['meta_description'])
-    
-    # Article content
-    content = article_data.get('content', '')
-    st.markdown(content)
-    
-    # Schema markup preview
-    if article_data.get('schema_markup'):
-        with st.expander("🔧 Schema Markup (JSON-LD)"):
-            st.json(article_data['schema_markup'])
-
-def display_article_editor(article_data):
-    """Display article editor"""
-    st.markdown("### ✏️ Edit Your Article")
-    
-    # Editable title
-    edited_title = st.text_input(
-        "Article Title:",
-        value=article_data.get('title', ''),
-        key="edit_article_title"
-    )
-    
-    # Editable meta description
-    edited_meta = st.text_area(
-        "Meta Description:",
-        value=article_data.get('meta_description', ''),
-        height=80,
-        key="edit_meta_description",
-        help="Keep under 160 characters for optimal SEO"
-    )
-    
-    # Editable content
-    edited_content = st.text_area(
-        "Article Content:",
-        value=article_data.get('content', ''),
-        height=400,
-        key="edit_article_content"
-    )
-    
-    # Save changes
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button("💾 Save Changes", type="primary"):
-            # Update the generated article
-            st.session_state.generated_article['title'] = edited_title
-            st.session_state.generated_article['meta_description'] = edited_meta
-            st.session_state.generated_article['content'] = edited_content
-            st.session_state.generated_article['word_count'] = len(edited_content.split())
-            
-            # Recalculate SEO score
-            generator = st.session_state.seo_generator
-            primary_keyword = article_data.get('primary_keyword', '')
-            secondary_keywords = article_data.get('secondary_keywords', [])
-            
-            new_analysis = generator.analyze_seo_score(edited_content, primary_keyword, secondary_keywords)
-            st.session_state.generated_article['seo_analysis'] = new_analysis
-            
-            st.success("✅ Changes saved successfully!")
-            st.rerun()
-    
-    with col2:
-        if st.button("🔄 Reset to Original"):
-            st.rerun()
-
-def display_seo_analysis(seo_analysis):
-    """Display detailed SEO analysis"""
-    st.markdown("### 📊 Detailed SEO Analysis")
-    
-    # Overall metrics
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Keyword Density", f"{seo_analysis.get('keyword_density', 0):.1f}%")
-        density = seo_analysis.get('keyword_density', 0)
-        if 1.0 <= density <= 2.0:
-            st.success("✅ Optimal density")
-        elif density < 1.0:
-            st.warning("⚠️ Low density")
-        else:
-            st.error("❌ Too high")
-    
-    with col2:
-        st.metric("Word Count", seo_analysis.get('word_count', 0))
-        words = seo_analysis.get('word_count', 0)
-        if 800 <= words <= 2000:
-            st.success("✅ Good length")
-        elif words < 800:
-            st.warning("⚠️ Consider longer")
-        else:
-            st.info("ℹ️ Very comprehensive")
-    
-    with col3:
-        st.metric("Headings (H2)", seo_analysis.get('h2_count', 0))
-        h2s = seo_analysis.get('h2_count', 0)
-        if h2s >= 3:
-            st.success("✅ Well structured")
-        else:
-            st.warning("⚠️ Add more headings")
-    
-    # Issues and recommendations
-    issues = seo_analysis.get('issues', [])
-    recommendations = seo_analysis.get('recommendations', [])
-    
-    if issues:
-        st.markdown("#### ⚠️ Issues Found")
-        for issue in issues:
-            st.warning(f"• {issue}")
-    
-    if recommendations:
-        st.markdown("#### 💡 Recommendations")
-        for rec in recommendations:
-            st.info(f"• {rec}")
-    
-    if not issues and not recommendations:
-        st.success("🎉 Excellent! No major SEO issues found.")
-
-def display_export_options(article_data):
-    """Display export options"""
-    st.markdown("### 💾 Export Your Article")
-    
-    # Export formats
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("#### 📝 Text Formats")
-        
-        # Markdown export
-        markdown_content = f"# {article_data.get('title', '')}\n\n"
-        markdown_content += f"**Meta Description:** {article_data.get('meta_description', '')}\n\n"
-        markdown_content += article_data.get('content', '')
-        
-        st.download_button(
-            label="📄 Download as Markdown",
-            data=markdown_content,
-            file_name=f"{article_data.get('title', 'article').replace(' ', '_').lower()}.md",
-            mime="text/markdown"
-        )
-        
-        # HTML export
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>{article_data.get('title', '')}</title>
-    <meta name="description" content="{article_data.get('meta_description', '')}">
-    <meta name="keywords" content="{article_data.get('primary_keyword', '')}">
-</head>
-<body>
-    <h1>{article_data.get('title', '')}</h1>
-    {article_data.get('content', '').replace('## ', '<h2>').replace('\n\n', '</p><p>').replace('\n', '<br>')}
-</body>
-</html>"""
-        
-        st.download_button(
-            label="🌐 Download as HTML",
-            data=html_content,
-            file_name=f"{article_data.get('title', 'article').replace(' ', '_').lower()}.html",
-            mime="text/html"
-        )
-    
-    with col2:
-        st.markdown("#### 🔧 SEO Data")
-        
-        # JSON export with all data
-        full_data = {
-            "article": article_data,
-            "exported_at": datetime.now().isoformat(),
-            "seo_settings": st.session_state.seo_settings
-        }
-        
-        st.download_button(
-            label="📊 Download SEO Data (JSON)",
-            data=json.dumps(full_data, indent=2),
-            file_name=f"seo_data_{article_data.get('title', 'article').replace(' ', '_').lower()}.json",
-            mime="application/json"
-        )
-        
-        # Schema markup export
-        if article_data.get('schema_markup'):
-            st.download_button(
-                label="🏷️ Download Schema Markup",
-                data=json.dumps(article_data['schema_markup'], indent=2),
-                file_name=f"schema_{article_data.get('title', 'article').replace(' ', '_').lower()}.json",
-                mime="application/json"
-            )
-    
-    # Copy to clipboard options
-    st.markdown("#### 📋 Quick Copy")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("📄 Copy Title"):
-            st.code(article_data.get('title', ''), language=None)
-    
-    with col2:
-        if st.button("📝 Copy Meta Description"):
-            st.code(article_data.get('meta_description', ''), language=None)
-    
-    with col3:
-        if st.button("🎯 Copy Primary Keyword"):
-            st.code(article_data.get('primary_keyword', ''), language=None)
-    
-    # Navigation to other tools
-    st.markdown("---")
-    st.markdown("#### 🚀 Next Steps")
-    
-    nav_col1, nav_col2, nav_col3 = st.columns(3)
-    
-    with nav_col1:
-        if st.button("✏️ Edit Content", type="secondary"):
-            st.session_state.current_page = "editor"
-            st.rerun()
-    
-    with nav_col2:
-        if st.button("📥 Download & Export", type="secondary"):
-            st.session_state.current_page = "download"
-            st.rerun()
-    
-    with nav_col3:
-        if st.button("📊 Generate More", type="secondary"):
-            st.session_state.current_page = "bulk"
-            st.rerun()
-
-    
-    def get_seo_grade(self, score: int) -> str:
+    @staticmethod
+    def get_seo_grade(score: int) -> str:
         """Convert SEO score to letter grade"""
-        if score >= 90:
-            return "A+"
-        elif score >= 80:
-            return "A"
-        elif score >= 70:
-            return "B"
-        elif score >= 60:
-            return "C"
-        elif score >= 50:
-            return "D"
-        else:
-            return "F"
-
-def render_content_generation_interface():
-    """Render the content generation interface"""
-    st.markdown("## 🚀 Generate SEO Content")
-    
-    # Check if we have content to work with
-    if 'current_content' not in st.session_state or not st.session_state.current_content:
-        st.warning("⚠️ No content detected. Please extract content first using the Content Input section.")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("📥 Go to Content Input", type="primary"):
-                st.session_state.current_page = "generator"
-                st.rerun()
-        
-        with col2:
-            if st.button("⚙️ Configure SEO Settings", type="secondary"):
-                st.session_state.current_page = "seo_settings"
-                st.rerun()
-        
-        return
-    
-    # Display source content summary
-    content_data = st.session_state.current_content
-    
-    with st.expander("📋 Source Content Summary", expanded=False):
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("📝 Words", content_data.get('word_count', 0))
-        with col2:
-            st.metric("⏱️ Read Time", f"{content_data.get('reading_time', 0)} min")
-        with col3:
-            st.metric("📰 Title", "✅" if content_data.get('title') else "❌")
-        
-        if content_data.get('title'):
-            st.markdown(f"**Title:** {content_data['title']}")
-        
-        preview = content_data.get('content', '')[:200] + "..." if len(content_data.get('content', '')) > 200 else content_data.get('content', '')
-        st.markdown(f"**Preview:** {preview}")
-    
-    # SEO Settings Quick Config
-    st.markdown("### ⚙️ SEO Configuration")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-                    primary_keyword = st.text_input(
-            "🎯 Primary Keyword *",
-            value=st.session_state.seo_settings.get('primary_keyword', ''),
-            placeholder="Enter main keyword to optimize for",
-            help="The main keyword you want to rank for"
-        )
-        
-        content_length = st.slider(
-            "📏 Target Word Count",
-            min_value=300,
-            max_value=3000,
-            value=st.session_state.seo_settings.get('content_length', 800),
-            step=100,
-            help="Target length for the generated article"
-        )
-    
-    with col2:
-        secondary_keywords = st.text_area(
-            "🔍 Secondary Keywords",
-            value='\n'.join(st.session_state.seo_settings.get('secondary_keywords', [])),
-            placeholder="Enter one keyword per line\nrelated keyword 1\nrelated keyword 2",
-            height=80,
-            help="Related keywords to include naturally"
-        )
-        
-        tone = st.selectbox(
-            "🎭 Content Tone",
-            ["professional", "conversational", "authoritative", "friendly", "technical"],
-            index=["professional", "conversational", "authoritative", "friendly", "technical"].index(
-                st.session_state.seo_settings.get('tone', 'professional')
-            ),
-            help="Writing style for the generated content"
-        )
-    
-    # Content type selection
-    content_type = st.selectbox(
-        "📄 Content Type",
-        ["blog_post", "how_to_guide", "review", "landing_page"],
-        format_func=lambda x: {
-            "blog_post": "📝 Blog Post",
-            "how_to_guide": "📋 How-To Guide", 
-            "review": "⭐ Review Article",
-            "landing_page": "🎯 Landing Page"
-        }[x],
-        index=["blog_post", "how_to_guide", "review", "landing_page"].index(
-            st.session_state.seo_settings.get('content_type', 'blog_post')
-        ),
-        help="Type of content to generate"
-    )
-    
-    # Update session state
-    secondary_keywords_list = [kw.strip() for kw in secondary_keywords.split('\n') if kw.strip()]
-    
-    st.session_state.seo_settings.update({
-        'primary_keyword': primary_keyword,
-        'secondary_keywords': secondary_keywords_list,
-        'content_length': content_length,
-        'tone': tone,
-        'content_type': content_type
-    })
-    
-    # Generation controls
-    st.markdown("---")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("🚀 Generate Article", type="primary", disabled=not primary_keyword):
-            generate_article_content()
-    
-    with col2:
-        if st.button("⚙️ Advanced Settings"):
-            st.session_state.current_page = "seo_settings" 
-            st.rerun()
-    
-    with col3:
-        if st.button("🔄 Reset Settings"):
-            st.session_state.seo_settings = {
-                'primary_keyword': '',
-                'secondary_keywords': [],
-                'content_length': 800,
-                'tone': 'professional',
-                'content_type': 'blog_post'
-            }
-            st.rerun()
-    
-    # Display generated content if available
-    if 'generated_article' in st.session_state and st.session_state.generated_article:
-        display_generated_article()
-
-def generate_article_content():
-    """Generate the SEO-optimized article"""
-    try:
-        # Initialize generator
-        if 'seo_generator' not in st.session_state:
-            st.session_state.seo_generator = SEOContentGenerator()
-        
-        # Show progress
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        status_text.text("🔄 Initializing content generation...")
-        progress_bar.progress(20)
-        
-        status_text.text("📝 Generating article structure...")
-        progress_bar.progress(40)
-        
-        # Generate content
-        generator = st.session_state.seo_generator
-        source_content = st.session_state.current_content
-        seo_settings = st.session_state.seo_settings
-        
-        status_text.text("🎯 Optimizing for SEO...")
-        progress_bar.progress(60)
-        
-        result = generator.generate_seo_article(source_content, seo_settings)
-        
-        status_text.text("📊 Analyzing SEO score...")
-        progress_bar.progress(80)
-        
-        if "error" in result:
-            st.error(f"❌ {result['error']}")
-            progress_bar.empty()
-            status_text.empty()
-            return
-        
-        # Store generated content
-        st.session_state.generated_article = result
-        
-        # Update user stats
-        if st.session_state.authenticated and 'auth_manager' in st.session_state:
-            st.session_state.auth_manager.update_user_stats(
-                st.session_state.username, 
-                content_generated=True
-            )
-        
-        progress_bar.progress(100)
-        status_text.text("✅ Article generated successfully!")
-        
-        # Clear progress indicators
-        import time
-        time.sleep(1)
-        progress_bar.empty()
-        status_text.empty()
-        
-        st.success("🎉 SEO-optimized article generated successfully!")
-        st.rerun()
-        
-    except Exception as e:
-        st.error(f"❌ Error generating content: {str(e)}")
-
-def display_generated_article():
-    """Display the generated article with options to edit and download"""
-    st.markdown("---")
-    st.markdown("## 📄 Generated Article")
-    
-    article_data = st.session_state.generated_article
-    
-    # SEO Score Display
-    seo_analysis = article_data.get('seo_analysis', {})
-    score = seo_analysis.get('score', 0)
-    grade = seo_analysis.get('grade', 'F')
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        score_color = "🟢" if score >= 80 else "🟡" if score >= 60 else "🔴"
-        st.metric("SEO Score", f"{score_color} {score}/100")
-    
-    with col2:
-        st.metric("Grade", f"📊 {grade}")
-    
-    with col3:
-        st.metric("Word Count", f"📝 {article_data.get('word_count', 0)}")
-    
-    with col4:
-        keyword_density = seo_analysis.get('keyword_density', 0)
-        st.metric("Keyword Density", f"🎯 {keyword_density:.1f}%")
-    
-    # Article content tabs
-    tab1, tab2, tab3, tab4 = st.tabs(["📄 Article", "✏️ Edit", "📊 SEO Analysis", "💾 Export"])
-    
-    with tab1:
-        display_article_preview(article_data)
-    
-    with tab2:
-        display_article_editor(article_data)
-    
-    with tab3:
-        display_seo_analysis(seo_analysis)
-    
-    with tab4:
-        display_export_options(article_data)
-
-def display_article_preview(article_data):
-    """Display article preview"""
-    st.markdown("### 📰 Article Preview")
-    
-    # Title
-    st.markdown(f"# {article_data.get('title', 'Untitled')}")
-    
-    # Meta description
-    if article_data.get('meta_description'):
-        with st.expander("📝 Meta Description"):
-            st.write(article_data['meta_description'])
-    
-    # Article content
-    content = article_data.get('content', '')
-    st.markdown(content)
-    
-    # Schema markup preview
-    if article_data.get('schema_markup'):
-        with st.expander("🔧 Schema Markup (JSON-LD)"):
-            st.json(article_data['schema_markup'])
-
-def display_article_editor(article_data):
-    """Display article editor"""
-    st.markdown("### ✏️ Edit Your Article")
-    
-    # Editable title
-    edited_title = st.text_input(
-        "Article Title:",
-        value=article_data.get('title', ''),
-        key="edit_article_title"
-    )
-    
-    # Editable meta description
-    edited_meta = st.text_area(
-        "Meta Description:",
-        value=article_data.get('meta_description', ''),
-        height=80,
-        key="edit_meta_description",
-        help="Keep under 160 characters for optimal SEO"
-    )
-    
-    # Editable content
-    edited_content = st.text_area(
-        "Article Content:",
-        value=article_data.get('content', ''),
-        height=400,
-        key="edit_article_content"
-    )
-    
-    # Save changes
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button("💾 Save Changes", type="primary"):
-            # Update the generated article
-            st.session_state.generated_article['title'] = edited_title
-            st.session_state.generated_article['meta_description'] = edited_meta
-            st.session_state.generated_article['content'] = edited_content
-            st.session_state.generated_article['word_count'] = len(edited_content.split())
-            
-            # Recalculate SEO score
-            generator = st.session_state.seo_generator
-            primary_keyword = article_data.get('primary_keyword', '')
-            secondary_keywords = article_data.get('secondary_keywords', [])
-            
-            new_analysis = generator.analyze_seo_score(edited_content, primary_keyword, secondary_keywords)
-            st.session_state.generated_article['seo_analysis'] = new_analysis
-            
-            st.success("✅ Changes saved successfully!")
-            st.rerun()
-    
-    with col2:
-        if st.button("🔄 Reset to Original"):
-            st.rerun()
-
-def display_seo_analysis(seo_analysis):
-    """Display detailed SEO analysis"""
-    st.markdown("### 📊 Detailed SEO Analysis")
-    
-    # Overall metrics
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Keyword Density", f"{seo_analysis.get('keyword_density', 0):.1f}%")
-        density = seo_analysis.get('keyword_density', 0)
-        if 1.0 <= density <= 2.0:
-            st.success("✅ Optimal density")
-        elif density < 1.0:
-            st.warning("⚠️ Low density")
-        else:
-            st.error("❌ Too high")
-    
-    with col2:
-        st.metric("Word Count", seo_analysis.get('word_count', 0))
-        words = seo_analysis.get('word_count', 0)
-        if 800 <= words <= 2000:
-            st.success("✅ Good length")
-        elif words < 800:
-            st.warning("⚠️ Consider longer")
-        else:
-            st.info("ℹ️ Very comprehensive")
-    
-    with col3:
-        st.metric("Headings (H2)", seo_analysis.get('h2_count', 0))
-        h2s = seo_analysis.get('h2_count', 0)
-        if h2s >= 3:
-            st.success("✅ Well structured")
-        else:
-            st.warning("⚠️ Add more headings")
-    
-    # Issues and recommendations
-    issues = seo_analysis.get('issues', [])
-    recommendations = seo_analysis.get('recommendations', [])
-    
-    if issues:
-        st.markdown("#### ⚠️ Issues Found")
-        for issue in issues:
-            st.warning(f"• {issue}")
-    
-    if recommendations:
-        st.markdown("#### 💡 Recommendations")
-        for rec in recommendations:
-            st.info(f"• {rec}")
-    
-    if not issues and not recommendations:
-        st.success("🎉 Excellent! No major SEO issues found.")
-
-def display_export_options(article_data):
-    """Display export options"""
-    st.markdown("### 💾 Export Your Article")
-    
-    # Export formats
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("#### 📝 Text Formats")
-        
-        # Markdown export
-        markdown_content = f"# {article_data.get('title', '')}\n\n"
-        markdown_content += f"**Meta Description:** {article_data.get('meta_description', '')}\n\n"
-        markdown_content += article_data.get('content', '')
-        
-        st.download_button(
-            label="📄 Download as Markdown",
-            data=markdown_content,
-            file_name=f"{article_data.get('title', 'article').replace(' ', '_').lower()}.md",
-            mime="text/markdown"
-        )
-        
-        # HTML export
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>{article_data.get('title', '')}</title>
-    <meta name="description" content="{article_data.get('meta_description', '')}">
-    <meta name="keywords" content="{article_data.get('primary_keyword', '')}">
-</head>
-<body>
-    <h1>{article_data.get('title', '')}</h1>
-    {article_data.get('content', '').replace('## ', '<h2>').replace('\n\n', '</p><p>').replace('\n', '<br>')}
-</body>
-</html>"""
-        
-        st.download_button(
-            label="🌐 Download as HTML",
-            data=html_content,
-            file_name=f"{article_data.get('title', 'article').replace(' ', '_').lower()}.html",
-            mime="text/html"
-        )
-    
-    with col2:
-        st.markdown("#### 🔧 SEO Data")
-        
-        # JSON export with all data
-        full_data = {
-            "article": article_data,
-            "exported_at": datetime.now().isoformat(),
-            "seo_settings": st.session_state.seo_settings
-        }
-        
-        st.download_button(
-            label="📊 Download SEO Data (JSON)",
-            data=json.dumps(full_data, indent=2),
-            file_name=f"seo_data_{article_data.get('title', 'article').replace(' ', '_').lower()}.json",
-            mime="application/json"
-        )
-        
-        # Schema markup export
-        if article_data.get('schema_markup'):
-            st.download_button(
-                label="🏷️ Download Schema Markup",
-                data=json.dumps(article_data['schema_markup'], indent=2),
-                file_name=f"schema_{article_data.get('title', 'article').replace(' ', '_').lower()}.json",
-                mime="application/json"
-            )
-    
-    # Copy to clipboard options
-    st.markdown("#### 📋 Quick Copy")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("📄 Copy Title"):
-            st.code(article_data.get('title', ''), language=None)
-    
-    with col2:
-        if st.button("📝 Copy Meta Description"):
-            st.code(article_data.get('meta_description', ''), language=None)
-    
-    with col3:
-        if st.button("🎯 Copy Primary Keyword"):
-            st.code(article_data.get('primary_keyword', ''), language=None)
-    
-    # Bulk generation option
-    st.markdown("---")
-    st.markdown("#### 🚀 Generate More Content")
-    
-    if st.button("📊 Generate Bulk Articles", type="secondary"):
-        st.session_state.current_page = "bulk"
-        st.rerun()
+        return _GRADES[bisect_right(_GRADE_THRESHOLDS, score)]
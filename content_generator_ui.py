@@ -0,0 +1,594 @@
+import streamlit as st
+import hashlib
+import json
+import re
+from datetime import datetime
+from string import Template
+from typing import Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, fall back to json
+    orjson = None
+
+from content_generator import PromptCache, SEOContentGenerator
+
+
+@st.cache_resource(show_spinner=False)
+def get_seo_generator() -> SEOContentGenerator:
+    """Process-wide generator shared by every session via st.cache_resource
+    
+    The generator only holds read-only templates and word banks, so concurrent
+    sessions can use it without locking; per-session state such as the prompt
+    cache is passed in per call.
+    """
+    return SEOContentGenerator()
+
+
+def _content_hash(content: str) -> str:
+    """Short fingerprint of article content for change detection"""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=128)
+def _score_content(content: str, primary_keyword: str, secondary_keywords: Tuple[str, ...]) -> Dict:
+    """Score edited content with the shared generator"""
+    return get_seo_generator().analyze_seo_score(content, primary_keyword, list(secondary_keywords))
+
+
+def _cached_seo_score(content: str, primary_keyword: str, secondary_keywords: List[str]) -> Dict:
+    """Memoized analyze_seo_score; unchanged edits are served from the Streamlit data cache"""
+    return _score_content(content, primary_keyword, tuple(sorted(secondary_keywords)))
+
+
+# HTML export page; the article body is converted by _markdown_to_html
+_HTML_TMPL = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <title>$title</title>
+    <meta name="description" content="$meta">
+    <meta name="keywords" content="$keyword">
+</head>
+<body>
+    <h1>$title</h1>
+    $body
+</body>
+</html>""")
+
+# Headings swallow their surrounding newlines so they are never wrapped in a paragraph
+_MD2HTML = re.compile(r'\n*^## (.+)$\n*|\n\n|\n', re.M)
+_MD_BREAKS = {'\n\n': '</p><p>', '\n': '<br>'}
+
+
+def _md2html_sub(match) -> str:
+    """Replacement for one _MD2HTML match: a heading between paragraphs or a break tag"""
+    heading = match.group(1)
+    return f'</p><h2>{heading}</h2><p>' if heading is not None else _MD_BREAKS[match.group(0)]
+
+
+def _markdown_to_html(content: str) -> str:
+    """Convert headings, paragraph breaks and line breaks to valid HTML in one pass"""
+    return f'<p>{_MD2HTML.sub(_md2html_sub, content)}</p>'.replace('<p></p>', '')
+
+
+@st.cache_data(show_spinner=False)
+def _build_exports(title: str, meta: str, content: str, primary_keyword: str) -> Tuple[str, str]:
+    """Render the Markdown and HTML downloads for an article"""
+    markdown_content = f"# {title}\n\n**Meta Description:** {meta}\n\n{content}"
+    html_content = _HTML_TMPL.substitute(
+        title=title, meta=meta, keyword=primary_keyword, body=_markdown_to_html(content)
+    )
+    return markdown_content, html_content
+
+
+# One match per non-empty line of the secondary keywords text area
+_SEC_RE = re.compile(r'[^\n\r]+')
+
+
+@st.cache_data(show_spinner=False)
+def _parse_secondary(raw: str) -> Tuple[str, ...]:
+    """Split the secondary keywords text into stripped, non-blank keywords"""
+    return tuple(kw for kw in (match.group().strip() for match in _SEC_RE.finditer(raw)) if kw)
+
+
+# Schema fields that differ between articles; @context, @type, author and publisher are constant
+_SCHEMA_KEY_FIELDS = ('headline', 'description', 'keywords', 'dateModified')
+
+
+def _schema_key(schema: Dict) -> str:
+    """Fingerprint of a schema markup dict, cheap enough to compute on every rerun"""
+    return _content_hash('\x1f'.join(str(schema.get(field, '')) for field in _SCHEMA_KEY_FIELDS))
+
+
+@st.cache_data(show_spinner=False)
+def _schema_json(schema_key: str, _schema: Dict) -> str:
+    """Pretty-printed JSON-LD for the schema preview and download; _schema is identified by schema_key"""
+    return json.dumps(_schema, indent=2)
+
+
+def _dump_json(data) -> bytes:
+    """Serialize an export payload with 2-space indentation"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+@st.cache_data(show_spinner=False)
+def _seo_metrics_table(density: float, words: int, h2s: int):
+    """Tabulate the headline SEO metrics with a status glyph for each"""
+    import pandas as pd
+    
+    if 1.0 <= density <= 2.0:
+        density_status = "✅ Optimal density"
+    elif density < 1.0:
+        density_status = "⚠️ Low density"
+    else:
+        density_status = "❌ Too high"
+    
+    if 800 <= words <= 2000:
+        length_status = "✅ Good length"
+    elif words < 800:
+        length_status = "⚠️ Consider longer"
+    else:
+        length_status = "ℹ️ Very comprehensive"
+    
+    structure_status = "✅ Well structured" if h2s >= 3 else "⚠️ Add more headings"
+    
+    return pd.DataFrame({
+        "Metric": ["Keyword Density", "Word Count", "Headings (H2)"],
+        "Value": [f"{density:.1f}%", str(words), str(h2s)],
+        "Status": [density_status, length_status, structure_status]
+    })
+
+
+def render_content_generation_interface():
+    """Render the content generation interface"""
+    st.markdown("## 🚀 Generate SEO Content")
+    
+    # Check if we have content to work with
+    if 'current_content' not in st.session_state or not st.session_state.current_content:
+        st.warning("⚠️ No content detected. Please extract content first using the Content Input section.")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("📥 Go to Content Input", type="primary"):
+                st.session_state.current_page = "content_input"
+                st.rerun()
+        
+        with col2:
+            if st.button("⚙️ Configure SEO Settings", type="secondary"):
+                st.session_state.current_page = "seo_settings"
+                st.rerun()
+        
+        return
+    
+    # Display source content summary
+    content_data = st.session_state.current_content
+    
+    with st.expander("📋 Source Content Summary", expanded=False):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("📝 Words", content_data.get('word_count', 0))
+        with col2:
+            st.metric("⏱️ Read Time", f"{content_data.get('reading_time', 0)} min")
+        with col3:
+            st.metric("📰 Title", "✅" if content_data.get('title') else "❌")
+        
+        if content_data.get('title'):
+            st.markdown(f"**Title:** {content_data['title']}")
+        
+        preview = content_data.get('content', '')[:200] + "..." if len(content_data.get('content', '')) > 200 else content_data.get('content', '')
+        st.markdown(f"**Preview:** {preview}")
+    
+    # SEO Settings Quick Config
+    st.markdown("### ⚙️ SEO Configuration")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        primary_keyword = st.text_input(
+            "🎯 Primary Keyword *",
+            value=st.session_state.seo_settings.get('primary_keyword', ''),
+            placeholder="Enter main keyword to optimize for",
+            help="The main keyword you want to rank for"
+        )
+        
+        content_length = st.slider(
+            "📏 Target Word Count",
+            min_value=300,
+            max_value=3000,
+            value=st.session_state.seo_settings.get('content_length', 800),
+            step=100,
+            help="Target length for the generated article"
+        )
+    
+    with col2:
+        secondary_keywords = st.text_area(
+            "🔍 Secondary Keywords",
+            value='\n'.join(st.session_state.seo_settings.get('secondary_keywords', [])),
+            placeholder="Enter one keyword per line\nrelated keyword 1\nrelated keyword 2",
+            height=80,
+            help="Related keywords to include naturally"
+        )
+        
+        tone = st.selectbox(
+            "🎭 Content Tone",
+            ["professional", "conversational", "authoritative", "friendly", "technical"],
+            index=["professional", "conversational", "authoritative", "friendly", "technical"].index(
+                st.session_state.seo_settings.get('tone', 'professional')
+            ),
+            help="Writing style for the generated content"
+        )
+    
+    # Content type selection
+    content_type = st.selectbox(
+        "📄 Content Type",
+        ["blog_post", "how_to_guide", "review", "landing_page"],
+        format_func=lambda x: {
+            "blog_post": "📝 Blog Post",
+            "how_to_guide": "📋 How-To Guide", 
+            "review": "⭐ Review Article",
+            "landing_page": "🎯 Landing Page"
+        }[x],
+        index=["blog_post", "how_to_guide", "review", "landing_page"].index(
+            st.session_state.seo_settings.get('content_type', 'blog_post')
+        ),
+        help="Type of content to generate"
+    )
+    
+    # Update session state; stored as a list since exporters concatenate it with other lists
+    secondary_keywords_list = list(_parse_secondary(secondary_keywords))
+    
+    new_settings = {
+        'primary_keyword': primary_keyword,
+        'secondary_keywords': secondary_keywords_list,
+        'content_length': content_length,
+        'tone': tone,
+        'content_type': content_type
+    }
+    current_settings = st.session_state.seo_settings
+    changed = {key: value for key, value in new_settings.items() if current_settings.get(key) != value}
+    if changed:
+        current_settings.update(changed)
+    
+    # Generation controls
+    st.markdown("---")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        if st.button("🚀 Generate Article", type="primary", disabled=not primary_keyword):
+            generate_article_content()
+    
+    with col2:
+        # Same settings return the cached article; this asks for a fresh variation instead
+        if st.button("🎲 New Variation", disabled=not primary_keyword,
+                     help="Generate a new article instead of reusing the one for these settings"):
+            generate_article_content(refresh=True)
+    
+    with col3:
+        if st.button("⚙️ Advanced Settings"):
+            st.session_state.current_page = "seo_settings" 
+            st.rerun()
+    
+    with col4:
+        if st.button("🔄 Reset Settings"):
+            st.session_state.seo_settings = {
+                'primary_keyword': '',
+                'secondary_keywords': [],
+                'content_length': 800,
+                'tone': 'professional',
+                'content_type': 'blog_post'
+            }
+            st.rerun()
+    
+    # Display generated content if available
+    if 'generated_article' in st.session_state and st.session_state.generated_article:
+        display_generated_article()
+
+def generate_article_content(refresh: bool = False):
+    """Generate the SEO-optimized article; refresh bypasses the session's article cache"""
+    try:
+        # Per-session article cache; the generator itself is shared
+        if 'prompt_cache' not in st.session_state:
+            st.session_state.prompt_cache = PromptCache()
+        
+        # Generate content
+        generator = get_seo_generator()
+        source_content = st.session_state.current_content
+        seo_settings = st.session_state.seo_settings
+        
+        with st.status("🔄 Generating SEO article...", expanded=False) as status:
+            result = generator.generate_seo_article(
+                source_content, seo_settings, prompt_cache=st.session_state.prompt_cache, refresh=refresh
+            )
+            
+            if "error" in result:
+                status.update(label="❌ Generation failed", state="error")
+                st.error(f"❌ {result['error']}")
+                return
+            
+            # Store generated content; UI-only state is kept beside the article so it never reaches exports.
+            # The fingerprint lets no-op editor saves skip rescoring.
+            st.session_state.generated_from_cache = result.pop('from_generative_cache', False)
+            st.session_state.generated_content_hash = _content_hash(result['content'])
+            st.session_state.generated_article = result
+            
+            # Update user stats
+            if st.session_state.authenticated and 'auth_manager' in st.session_state:
+                st.session_state.auth_manager.update_user_stats(
+                    st.session_state.username, 
+                    content_generated=True
+                )
+            
+            status.update(label="✅ Article generated successfully!", state="complete")
+        
+        st.rerun()
+        
+    except Exception as e:
+        st.error(f"❌ Error generating content: {str(e)}")
+
+def display_generated_article():
+    """Display the generated article with options to edit and download"""
+    st.markdown("---")
+    st.markdown("## 📄 Generated Article")
+    
+    article_data = st.session_state.generated_article
+    
+    if st.session_state.get('generated_from_cache'):
+        st.info("♻️ Refined from a similar previously generated article")
+    
+    # SEO Score Display
+    seo_analysis = article_data.get('seo_analysis', {})
+    score = seo_analysis.get('score', 0)
+    grade = seo_analysis.get('grade', 'F')
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        score_color = "🟢" if score >= 80 else "🟡" if score >= 60 else "🔴"
+        st.metric("SEO Score", f"{score_color} {score}/100")
+    
+    with col2:
+        st.metric("Grade", f"📊 {grade}")
+    
+    with col3:
+        st.metric("Word Count", f"📝 {article_data.get('word_count', 0)}")
+    
+    with col4:
+        keyword_density = seo_analysis.get('keyword_density', 0)
+        st.metric("Keyword Density", f"🎯 {keyword_density:.1f}%")
+    
+    # Enhanced SEO Analysis Button
+    if st.button("📊 Advanced SEO Analysis", type="secondary"):
+        # Check if enhanced analysis is available
+        detailed_analysis = seo_analysis.get('detailed_analysis')
+        if detailed_analysis:
+            st.session_state.current_seo_analysis = detailed_analysis
+            st.session_state.current_page = "seo_analysis"
+            st.rerun()
+        else:
+            st.info("💡 Enhanced SEO analysis will be available when the advanced analyzer is integrated")
+    
+    # Article content tabs
+    tab1, tab2, tab3, tab4 = st.tabs(["📄 Article", "✏️ Edit", "📊 SEO Analysis", "💾 Export"])
+    
+    with tab1:
+        display_article_preview(article_data)
+    
+    with tab2:
+        display_article_editor(article_data)
+    
+    with tab3:
+        display_seo_analysis(seo_analysis)
+    
+    with tab4:
+        display_export_options(article_data)
+
+def display_article_preview(article_data):
+    """Display article preview"""
+    st.markdown("### 📰 Article Preview")
+    
+    # Title
+    st.markdown(f"# {article_data.get('title', 'Untitled')}")
+    
+    # Meta description
+    if article_data.get('meta_description'):
+        with st.expander("📝 Meta Description"):
+            st.write(article_data['meta_description'])
+    
+    # Article content
+    content = article_data.get('content', '')
+    st.markdown(content)
+    
+    # Schema markup preview
+    if article_data.get('schema_markup'):
+        with st.expander("🔧 Schema Markup (JSON-LD)"):
+            st.code(_schema_json(_schema_key(article_data['schema_markup']), article_data['schema_markup']), language='json')
+
+def display_article_editor(article_data):
+    """Display article editor"""
+    st.markdown("### ✏️ Edit Your Article")
+    
+    # Editable title
+    edited_title = st.text_input(
+        "Article Title:",
+        value=article_data.get('title', ''),
+        key="edit_article_title"
+    )
+    
+    # Editable meta description
+    edited_meta = st.text_area(
+        "Meta Description:",
+        value=article_data.get('meta_description', ''),
+        height=80,
+        key="edit_meta_description",
+        help="Keep under 160 characters for optimal SEO"
+    )
+    
+    # Editable content
+    edited_content = st.text_area(
+        "Article Content:",
+        value=article_data.get('content', ''),
+        height=400,
+        key="edit_article_content"
+    )
+    
+    # Save changes
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("💾 Save Changes", type="primary"):
+            # Update the generated article
+            st.session_state.generated_article['title'] = edited_title
+            st.session_state.generated_article['meta_description'] = edited_meta
+            
+            # Title/meta-only edits leave the score valid; skip rescoring and the rerun
+            content_hash = _content_hash(edited_content)
+            if content_hash == st.session_state.get('generated_content_hash'):
+                st.toast("✅ Changes saved successfully!")
+            else:
+                st.session_state.generated_article['content'] = edited_content
+                st.session_state.generated_article['word_count'] = len(edited_content.split())
+                st.session_state.generated_content_hash = content_hash
+                
+                # Recalculate SEO score
+                primary_keyword = article_data.get('primary_keyword', '')
+                secondary_keywords = article_data.get('secondary_keywords', [])
+                
+                new_analysis = _cached_seo_score(edited_content, primary_keyword, secondary_keywords)
+                st.session_state.generated_article['seo_analysis'] = new_analysis
+                
+                st.success("✅ Changes saved successfully!")
+                st.rerun()
+    
+    with col2:
+        if st.button("🔄 Reset to Original"):
+            st.rerun()
+
+def display_seo_analysis(seo_analysis):
+    """Display detailed SEO analysis"""
+    st.markdown("### 📊 Detailed SEO Analysis")
+    
+    # Overall metrics, shipped to the browser as a single table
+    st.dataframe(
+        _seo_metrics_table(
+            seo_analysis.get('keyword_density', 0),
+            seo_analysis.get('word_count', 0),
+            seo_analysis.get('h2_count', 0)
+        ),
+        hide_index=True,
+        use_container_width=True
+    )
+    
+    # Issues and recommendations
+    issues = seo_analysis.get('issues', [])
+    recommendations = seo_analysis.get('recommendations', [])
+    
+    if issues:
+        st.markdown("#### ⚠️ Issues Found")
+        for issue in issues:
+            st.warning(f"• {issue}")
+    
+    if recommendations:
+        st.markdown("#### 💡 Recommendations")
+        for rec in recommendations:
+            st.info(f"• {rec}")
+    
+    if not issues and not recommendations:
+        st.success("🎉 Excellent! No major SEO issues found.")
+
+def display_export_options(article_data):
+    """Display export options"""
+    st.markdown("### 💾 Export Your Article")
+    
+    # Export formats
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### 📝 Text Formats")
+        
+        # Markdown and HTML exports, rebuilt only when the article changes
+        markdown_content, html_content = _build_exports(
+            article_data.get('title', ''),
+            article_data.get('meta_description', ''),
+            article_data.get('content', ''),
+            article_data.get('primary_keyword', '')
+        )
+        
+        st.download_button(
+            label="📄 Download as Markdown",
+            data=markdown_content,
+            file_name=f"{article_data.get('title', 'article').replace(' ', '_').lower()}.md",
+            mime="text/markdown"
+        )
+        
+        st.download_button(
+            label="🌐 Download as HTML",
+            data=html_content,
+            file_name=f"{article_data.get('title', 'article').replace(' ', '_').lower()}.html",
+            mime="text/html"
+        )
+    
+    with col2:
+        st.markdown("#### 🔧 SEO Data")
+        
+        # JSON export with all data, built and serialized only when clicked
+        seo_settings = st.session_state.seo_settings
+        
+        st.download_button(
+            label="📊 Download SEO Data (JSON)",
+            data=lambda: _dump_json({
+                "article": article_data,
+                "exported_at": datetime.now().isoformat(),
+                "seo_settings": seo_settings
+            }),
+            file_name=f"seo_data_{article_data.get('title', 'article').replace(' ', '_').lower()}.json",
+            mime="application/json"
+        )
+        
+        # Schema markup export
+        if article_data.get('schema_markup'):
+            st.download_button(
+                label="🏷️ Download Schema Markup",
+                data=_schema_json(_schema_key(article_data['schema_markup']), article_data['schema_markup']),
+                file_name=f"schema_{article_data.get('title', 'article').replace(' ', '_').lower()}.json",
+                mime="application/json"
+            )
+    
+    # Copy to clipboard options
+    st.markdown("#### 📋 Quick Copy")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("📄 Copy Title"):
+            st.code(article_data.get('title', ''), language=None)
+    
+    with col2:
+        if st.button("📝 Copy Meta Description"):
+            st.code(article_data.get('meta_description', ''), language=None)
+    
+    with col3:
+        if st.button("🎯 Copy Primary Keyword"):
+            st.code(article_data.get('primary_keyword', ''), language=None)
+    
+    # Navigation to other tools
+    st.markdown("---")
+    st.markdown("#### 🚀 Next Steps")
+    
+    nav_col1, nav_col2, nav_col3 = st.columns(3)
+    
+    with nav_col1:
+        if st.button("✏️ Edit Content", type="secondary"):
+            st.session_state.current_page = "editor"
+            st.rerun()
+    
+    with nav_col2:
+        if st.button("📥 Download & Export", type="secondary"):
+            st.session_state.current_page = "download"
+            st.rerun()
+    
+    with nav_col3:
+        if st.button("📊 Generate More", type="secondary"):
+            st.session_state.current_page = "bulk"
+            st.rerun()
@@ -1,20 +1,135 @@
 import streamlit as st
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin
+import asyncio
+import copy
+import importlib.util
 import re
-from typing import Dict, Optional, Tuple, List
+import threading
+import httpx
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+from urllib.parse import urljoin
+from typing import Callable, Dict, Optional, Tuple, List
+from collections import OrderedDict
 import time
 from datetime import datetime
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional accelerator, fall back to BeautifulSoup
+    LexborHTMLParser = None
+
+# Only these top-level tags (and their subtrees) are built; stray scripts, styles and SVG are skipped.
+# Noise containers are kept whole so extract_main_content can decompose them with their children;
+# otherwise their div/p/a descendants would survive as top-level nodes.
+ARTICLE_STRAINER = SoupStrainer([
+    'title', 'meta', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'article', 'section', 'div', 'p', 'img', 'a', 'main',
+    'nav', 'header', 'footer', 'aside', 'ad'
+])
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Chrome and non-prose elements that can still appear nested inside strained containers
+_NOISE_TAGS = frozenset(["script", "style", "nav", "header", "footer", "aside", "ad"])
+_NOISE_SELECTOR = ", ".join(sorted(_NOISE_TAGS))
+
+# Heading tag -> level, plus the name set used to find them in one pass
+_HEADING_LEVELS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+_HEADING_NAMES = frozenset(_HEADING_LEVELS)
+_HEADING_SELECTOR = ", ".join(_HEADING_LEVELS)
+
+# http(s) URL with a non-empty host; checked on every rerun while a URL is being typed
+_URL_RE = re.compile(r'^https?://[^\s/$.?#][^\s]*$', re.IGNORECASE)
+
+# str.translate table dropping C0 control characters and DEL; whitespace controls are kept
+# so the split()/join() normalisation below still turns them into word breaks
+_CONTROL_CHARS = dict.fromkeys([c for c in range(32) if not chr(c).isspace()] + [127])
+
+def _normalize_text(text: str) -> str:
+    """Drop control characters and collapse all Unicode whitespace runs to single spaces"""
+    return ' '.join(text.translate(_CONTROL_CHARS).split())
+
+def _declared_charset(content_type: str) -> Optional[str]:
+    """Return the charset parameter of a Content-Type header, or None if it has none"""
+    for param in content_type.split(';')[1:]:
+        name, _, value = param.strip().partition('=')
+        if name.lower() == 'charset':
+            return value.strip('"\' ') or None
+    return None
+
+def _make_soup(markup: bytes, encoding: Optional[str] = None) -> BeautifulSoup:
+    """Parse HTML with the C-backed lxml parser, falling back to html.parser if it is missing
+    
+    encoding is the server-declared charset; without one, bs4 detects it from the markup.
+    """
+    options = dict(from_encoding=encoding, exclude_encodings=['ascii'], parse_only=ARTICLE_STRAINER)
+    try:
+        return BeautifulSoup(markup, 'lxml', **options)
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser', **options)
+
 class ContentExtractor:
     """Enhanced content extraction from various sources"""
     
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    
+    # Concurrent fetches per extract_many batch
+    MAX_CONCURRENT_FETCHES = 10
+    
+    # Lookup order for the title, main content and meta description
+    TITLE_SELECTORS = (
+        'h1',
+        'title',
+        '[property="og:title"]',
+        '[name="twitter:title"]',
+        '.article-title',
+        '.post-title',
+        '.entry-title'
+    )
+    
+    CONTENT_SELECTORS = (
+        'article',
+        '.article-content',
+        '.post-content',
+        '.entry-content',
+        '.content',
+        '.main-content',
+        '#content',
+        '.article-body',
+        '.story-body'
+    )
+    
+    META_DESC_ATTRS = (
+        ('name', 'description'),
+        ('property', 'og:description'),
+        ('name', 'twitter:description')
+    )
+    
+    # HTML backend: "selectolax" (lexbor C parser) when installed, else "bs4";
+    # set to "bs4" on an instance to compare both extractions
+    HTML_BACKEND = "selectolax" if LexborHTMLParser is not None else "bs4"
+    
+    # Extracted pages kept per URL; fresh entries skip the network, stale ones are revalidated
+    RESPONSE_CACHE_SIZE = 128
+    RESPONSE_CACHE_TTL = 3600
+    
+    # Paragraphs joined when no content selector matched; stops the fallback walk on huge pages
+    MAX_FALLBACK_PARAGRAPHS = 200
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        # Pooled keep-alive client; shared by every session via get_content_extractor
+        self.client = httpx.Client(
+            headers=self.HEADERS,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=60),
+            timeout=30,
+            follow_redirects=True
+        )
+        
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
     
     def extract_from_url(self, url: str) -> Tuple[bool, Dict]:
         """Extract content from article URL"""
@@ -23,19 +138,33 @@ class ContentExtractor:
             if not self.is_valid_url(url):
                 return False, {"error": "Invalid URL format"}
             
+            cached = self._get_cached_response(url)
+            if cached and time.time() - cached["fetched_at"] < self.RESPONSE_CACHE_TTL:
+                return True, copy.deepcopy(cached["data"])
+            
             # Add progress indicator
             progress_placeholder = st.empty()
             progress_placeholder.info("🔍 Extracting content from URL...")
             
-            # Fetch content
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            # Fetch content, revalidating a stale cache entry when the server gave us validators
+            conditional_headers = {}
+            if cached:
+                if cached["etag"]:
+                    conditional_headers['If-None-Match'] = cached["etag"]
+                if cached["last_modified"]:
+                    conditional_headers['If-Modified-Since'] = cached["last_modified"]
             
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.client.get(url, headers=conditional_headers)
+            if cached and response.status_code == 304:
+                self._cache_response(url, response, cached["data"], previous=cached)
+                progress_placeholder.empty()
+                return True, copy.deepcopy(cached["data"])
+            response.raise_for_status()
             
-            # Extract content
-            extracted_data = self.parse_article_content(soup, url)
+            # Parse and extract content
+            extracted_data = self.parse_response(response, url)
+            self._cache_response(url, response, extracted_data)
+            extracted_data = copy.deepcopy(extracted_data)
             
             progress_placeholder.success("✅ Content extracted successfully!")
             time.sleep(1)
@@ -43,62 +172,231 @@ class ContentExtractor:
             
             return True, extracted_data
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             error_msg = f"Error fetching URL: {str(e)}"
             return False, {"error": error_msg}
         except Exception as e:
             error_msg = f"Error parsing content: {str(e)}"
             return False, {"error": error_msg}
     
-    def parse_article_content(self, soup: BeautifulSoup, url: str) -> Dict:
-        """Parse and extract article content from HTML"""
+    def _get_cached_response(self, url: str) -> Optional[Dict]:
+        """Return the cache entry for url, marking it most recently used"""
+        with self._response_cache_lock:
+            entry = self._response_cache.get(url)
+            if entry is not None:
+                self._response_cache.move_to_end(url)
+            return entry
+    
+    def _cache_response(self, url: str, response: httpx.Response, extracted_data: Dict,
+                        previous: Optional[Dict] = None) -> None:
+        """Remember extracted data with the response's validators, evicting the oldest entries
+        
+        A 304 need not repeat the validators, so any it omits are kept from the previous entry.
+        """
+        previous = previous or {}
+        entry = {
+            "data": extracted_data,
+            "etag": response.headers.get('ETag') or previous.get("etag"),
+            "last_modified": response.headers.get('Last-Modified') or previous.get("last_modified"),
+            "fetched_at": time.time()
+        }
+        with self._response_cache_lock:
+            self._response_cache[url] = entry
+            self._response_cache.move_to_end(url)
+            while len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+    
+    async def extract_from_url_async(self, url: str, client: httpx.AsyncClient) -> Tuple[bool, Dict]:
+        """Extract content from article URL without blocking, using a shared async client"""
+        if not self.is_valid_url(url):
+            return False, {"error": "Invalid URL format"}
         
-        # Extract title
-        title = self.extract_title(soup)
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            return False, {"error": f"Error fetching URL: {str(e)}"}
         
-        # Extract main content
-        content = self.extract_main_content(soup)
+        try:
+            return True, self.parse_response(response, url)
+        except Exception as e:
+            return False, {"error": f"Error parsing content: {str(e)}"}
+    
+    async def extract_many(self, urls: List[str]) -> List[Tuple[bool, Dict]]:
+        """Fetch and extract several URLs concurrently, one (success, data) pair per URL in order"""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        
+        # The client's pool is bound to the running event loop, so it lives for one batch
+        async with httpx.AsyncClient(
+            headers=self.HEADERS,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=30,
+            follow_redirects=True
+        ) as client:
+            async def bounded(url: str) -> Tuple[bool, Dict]:
+                async with semaphore:
+                    return await self.extract_from_url_async(url, client)
+            
+            results = await asyncio.gather(*(bounded(url) for url in urls), return_exceptions=True)
         
-        # Extract metadata
-        meta_description = self.extract_meta_description(soup)
-        meta_keywords = self.extract_meta_keywords(soup)
+        return [
+            (False, {"error": f"Error extracting content: {str(result)}"}) if isinstance(result, Exception) else result
+            for result in results
+        ]
+    
+    def extract_from_urls(self, urls: List[str]) -> List[Tuple[bool, Dict]]:
+        """Synchronous entry point to extract_many for the Streamlit script thread"""
+        return asyncio.run(self.extract_many(urls))
+    
+    def parse_response(self, response: httpx.Response, url: str) -> Dict:
+        """Parse a fetched page with the configured HTML backend and extract the article"""
+        return self.parse_html(response.content, response.headers.get('Content-Type', ''), url)
+    
+    def parse_html(self, content: bytes, content_type: str, url: str) -> Dict:
+        """Parse raw page bytes with the configured HTML backend and extract the article"""
+        # Trust the server's charset only when it actually sent one
+        declared_encoding = _declared_charset(content_type)
+        
+        if self.HTML_BACKEND == "selectolax":
+            tree = None
+            if declared_encoding:
+                try:
+                    tree = LexborHTMLParser(content.decode(declared_encoding, errors='replace'))
+                except (LookupError, UnicodeDecodeError):  # unknown charset name; detect it instead
+                    pass
+            if tree is None:
+                tree = LexborHTMLParser(content, encoding=True)
+            return self.parse_article_tree(tree, url)
+        
+        return self.parse_article_content(_make_soup(content, declared_encoding), url)
+    
+    def parse_article_tree(self, tree, url: str) -> Dict:
+        """Extract article content from a selectolax tree; mirrors parse_article_content"""
+        return self._extract_article(
+            tree, url, self._tree_title, self._tree_main_content,
+            self._tree_meta, self._tree_images, self._tree_headings
+        )
+    
+    def _tree_title(self, tree) -> str:
+        """selectolax counterpart of extract_title"""
+        for selector in self.TITLE_SELECTORS:
+            node = tree.css_first(selector)
+            if node:
+                title = node.attributes.get('content') or node.text()
+                if title and len(title.strip()) > 0:
+                    return title.strip()
         
-        # Extract images
-        images = self.extract_images(soup, url)
+        return "Untitled Article"
+    
+    def _tree_main_content(self, tree) -> str:
+        """selectolax counterpart of extract_main_content"""
+        for node in tree.css(_NOISE_SELECTOR):
+            node.decompose()
         
-        # Calculate reading time
-        reading_time = self.calculate_reading_time(content)
+        content_text = ""
+        
+        for selector in self.CONTENT_SELECTORS:
+            node = tree.css_first(selector)
+            if node:
+                text = node.text(separator=' ', strip=True, skip_empty=True)
+                if len(text) > 500:
+                    content_text = text
+                    break
+                if len(text) > len(content_text):
+                    content_text = text
         
-        # Extract headings structure
-        headings = self.extract_headings(soup)
+        if not content_text:
+            content_text = ' '.join(p.text(strip=True) for p in tree.css('p')[:self.MAX_FALLBACK_PARAGRAPHS])
+        
+        return _normalize_text(content_text)
+    
+    def _tree_meta(self, tree) -> Dict[str, str]:
+        """selectolax counterpart of _collect_meta"""
+        metas = {}
+        for node in (tree.head or tree).css('meta'):
+            key = node.attributes.get('name') or node.attributes.get('property')
+            content = node.attributes.get('content')
+            if key and content:
+                metas.setdefault(key.lower(), content)
+        return metas
+    
+    def _tree_images(self, tree, base_url: str) -> List[Dict]:
+        """selectolax counterpart of extract_images"""
+        return [
+            {
+                'src': urljoin(base_url, img.attributes['src']),
+                'alt': img.attributes.get('alt') or '',
+                'title': img.attributes.get('title') or ''
+            }
+            for img in tree.css('img[src]')[:5]  # Limit to first 5 images
+        ]
+    
+    def _tree_headings(self, tree) -> List[Dict]:
+        """selectolax counterpart of extract_headings"""
+        return [
+            {
+                'level': _HEADING_LEVELS[heading.tag],
+                'text': heading.text(strip=True),
+                'tag': heading.tag
+            }
+            for heading in tree.css(_HEADING_SELECTOR)
+        ]
+    
+    def parse_article_content(self, soup: BeautifulSoup, url: str) -> Dict:
+        """Parse and extract article content from HTML"""
+        return self._extract_article(
+            soup, url, self.extract_title, self.extract_main_content,
+            self._collect_meta, self.extract_images, self.extract_headings
+        )
+    
+    def _extract_article(self, doc, url: str, extract_title: Callable, extract_main_content: Callable,
+                         collect_meta: Callable, extract_images: Callable, extract_headings: Callable) -> Dict:
+        """Run one backend's extractors over doc in the order shared by both HTML backends
         
+        The title is read before extract_main_content decomposes the noise containers;
+        images and headings are read after, so neither backend reports a site-header <h1>.
+        """
+        # Extract title
+        title = extract_title(doc)
+        
+        # Extract main content, removing noise elements from doc
+        content = extract_main_content(doc)
+        
+        # Extract metadata from one pass over the <meta> tags
+        metas = collect_meta(doc)
+        
+        return self._article_record(
+            title=title,
+            content=content,
+            meta_description=self.extract_meta_description(doc, metas),
+            meta_keywords=self.extract_meta_keywords(doc, metas),
+            images=extract_images(doc, url),
+            headings=extract_headings(doc),
+            url=url
+        )
+    
+    def _article_record(self, title: str, content: str, meta_description: str, meta_keywords: List[str],
+                        images: List[Dict], headings: List[Dict], url: str) -> Dict:
+        """Assemble the extracted-article dict shared by both HTML backends"""
+        word_count = len(content.split()) if content else 0
         return {
             "title": title,
             "content": content,
             "meta_description": meta_description,
             "meta_keywords": meta_keywords,
             "images": images,
-            "reading_time": reading_time,
+            "reading_time": self._reading_time_from_words(word_count),
             "headings": headings,
             "url": url,
             "extracted_at": datetime.now().isoformat(),
-            "word_count": len(content.split()) if content else 0
+            "word_count": word_count
         }
     
     def extract_title(self, soup: BeautifulSoup) -> str:
         """Extract article title"""
         # Try multiple selectors for title
-        title_selectors = [
-            'h1',
-            'title',
-            '[property="og:title"]',
-            '[name="twitter:title"]',
-            '.article-title',
-            '.post-title',
-            '.entry-title'
-        ]
-        
-        for selector in title_selectors:
+        for selector in self.TITLE_SELECTORS:
             element = soup.select_one(selector)
             if element:
                 title = element.get('content') if element.get('content') else element.get_text()
@@ -110,118 +408,115 @@ class ContentExtractor:
     def extract_main_content(self, soup: BeautifulSoup) -> str:
         """Extract main article content"""
         # Remove unwanted elements
-        for element in soup(["script", "style", "nav", "header", "footer", "aside", "ad"]):
+        for element in soup.find_all(_NOISE_TAGS):
             element.decompose()
         
-        # Try multiple selectors for main content
-        content_selectors = [
-            'article',
-            '.article-content',
-            '.post-content',
-            '.entry-content',
-            '.content',
-            '.main-content',
-            '#content',
-            '.article-body',
-            '.story-body'
-        ]
-        
         content_text = ""
         
-        for selector in content_selectors:
-            elements = soup.select(selector)
-            if elements:
-                for element in elements:
-                    text = element.get_text(separator=' ', strip=True)
-                    if len(text) > len(content_text):
-                        content_text = text
+        # Selectors are in priority order: the first match with substantial text wins,
+        # otherwise keep the longest short match seen
+        for selector in self.CONTENT_SELECTORS:
+            element = soup.select_one(selector)
+            if element:
+                text = element.get_text(separator=' ', strip=True)
+                if len(text) > 500:
+                    content_text = text
+                    break
+                if len(text) > len(content_text):
+                    content_text = text
         
         # If no specific content found, try paragraphs
         if not content_text:
-            paragraphs = soup.find_all('p')
+            paragraphs = soup.find_all('p', limit=self.MAX_FALLBACK_PARAGRAPHS)
             content_text = ' '.join([p.get_text(strip=True) for p in paragraphs])
         
         # Clean up text
-        content_text = re.sub(r'\s+', ' ', content_text).strip()
+        content_text = _normalize_text(content_text)
         
         return content_text
     
-    def extract_meta_description(self, soup: BeautifulSoup) -> str:
+    def _collect_meta(self, soup: BeautifulSoup) -> Dict[str, str]:
+        """Map lowercased meta name/property to content; the first non-empty tag per key wins"""
+        metas = {}
+        for element in (soup.head or soup).find_all('meta'):
+            key = element.get('name') or element.get('property')
+            content = element.get('content')
+            if key and content:
+                metas.setdefault(key.lower(), content)
+        return metas
+    
+    def extract_meta_description(self, soup: BeautifulSoup, metas: Optional[Dict[str, str]] = None) -> str:
         """Extract meta description"""
-        meta_selectors = [
-            '[name="description"]',
-            '[property="og:description"]',
-            '[name="twitter:description"]'
-        ]
+        if metas is None:
+            metas = self._collect_meta(soup)
         
-        for selector in meta_selectors:
-            element = soup.select_one(selector)
-            if element and element.get('content'):
-                return element.get('content').strip()
+        for _, value in self.META_DESC_ATTRS:
+            description = metas.get(value, '').strip()
+            if description:
+                return description
         
         return ""
     
-    def extract_meta_keywords(self, soup: BeautifulSoup) -> List[str]:
+    def extract_meta_keywords(self, soup: BeautifulSoup, metas: Optional[Dict[str, str]] = None) -> List[str]:
         """Extract meta keywords"""
-        keywords_element = soup.select_one('[name="keywords"]')
-        if keywords_element and keywords_element.get('content'):
-            keywords = keywords_element.get('content').split(',')
-            return [kw.strip() for kw in keywords if kw.strip()]
-        return []
+        if metas is None:
+            metas = self._collect_meta(soup)
+        
+        keywords = metas.get('keywords', '').split(',')
+        return [kw.strip() for kw in keywords if kw.strip()]
     
     def extract_images(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
         """Extract images from article"""
-        images = []
-        img_elements = soup.find_all('img')
-        
-        for img in img_elements[:5]:  # Limit to first 5 images
-            src = img.get('src')
-            if src:
-                # Convert relative URLs to absolute
-                if src.startswith('//'):
-                    src = 'https:' + src
-                elif src.startswith('/'):
-                    src = urljoin(base_url, src)
-                
-                images.append({
-                    'src': src,
-                    'alt': img.get('alt', ''),
-                    'title': img.get('title', '')
-                })
-        
-        return images
+        # urljoin resolves protocol-relative, root-relative and relative sources against the page;
+        # limit= stops the tree walk after the first 5 images instead of collecting them all
+        return [
+            {
+                'src': urljoin(base_url, img['src']),
+                'alt': img.get('alt', ''),
+                'title': img.get('title', '')
+            }
+            for img in soup.find_all('img', src=True, limit=5)
+        ]
     
     def extract_headings(self, soup: BeautifulSoup) -> List[Dict]:
         """Extract heading structure"""
-        headings = []
-        heading_tags = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        
-        for heading in heading_tags:
-            headings.append({
-                'level': int(heading.name[1]),
+        return [
+            {
+                'level': _HEADING_LEVELS[heading.name],
                 'text': heading.get_text(strip=True),
                 'tag': heading.name
-            })
-        
-        return headings
+            }
+            for heading in soup.find_all(_HEADING_NAMES)
+        ]
+    
+    def combine_articles(self, articles: List[Dict]) -> Dict:
+        """Merge several extracted articles into one source record, keeping their order"""
+        first = articles[0]
+        return self._article_record(
+            title=first["title"],
+            content="\n\n".join(article["content"] for article in articles if article["content"]),
+            meta_description=first["meta_description"],
+            meta_keywords=list(dict.fromkeys(kw for article in articles for kw in article["meta_keywords"])),
+            images=[image for article in articles for image in article["images"]][:5],
+            headings=[heading for article in articles for heading in article["headings"]],
+            url=first["url"]
+        )
     
     def calculate_reading_time(self, content: str) -> int:
         """Calculate estimated reading time in minutes"""
         if not content:
             return 0
         
-        words = len(content.split())
+        return self._reading_time_from_words(len(content.split()))
+    
+    def _reading_time_from_words(self, words: int) -> int:
+        """Reading time in minutes for an already-counted number of words"""
         # Average reading speed: 200-250 words per minute
-        reading_time = max(1, round(words / 225))
-        return reading_time
+        return max(1, round(words / 225)) if words else 0
     
     def is_valid_url(self, url: str) -> bool:
         """Validate URL format"""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except:
-            return False
+        return bool(url) and _URL_RE.match(url) is not None
     
     def extract_from_text(self, text: str) -> Dict:
         """Process manual text input"""
@@ -229,7 +524,7 @@ class ContentExtractor:
             return {"error": "No text provided"}
         
         # Clean text
-        cleaned_text = re.sub(r'\s+', ' ', text.strip())
+        cleaned_text = _normalize_text(text)
         
         # Extract potential title (first line if it looks like a title)
         lines = cleaned_text.split('\n')
@@ -243,28 +538,30 @@ class ContentExtractor:
             title = potential_title
             content = '\n'.join(lines[1:]).strip() if len(lines) > 1 else cleaned_text
         
+        word_count = len(content.split())
         return {
             "title": title or "Manual Text Input",
             "content": content,
             "meta_description": "",
             "meta_keywords": [],
             "images": [],
-            "reading_time": self.calculate_reading_time(content),
+            "reading_time": self._reading_time_from_words(word_count),
             "headings": [],
             "url": "",
             "extracted_at": datetime.now().isoformat(),
-            "word_count": len(content.split())
+            "word_count": word_count
         }
 
+@st.cache_resource(show_spinner=False)
+def get_content_extractor() -> ContentExtractor:
+    """Process-wide extractor so its connection pool survives reruns and is shared across sessions"""
+    return ContentExtractor()
+
 def render_content_input_interface():
     """Render enhanced content input interface"""
     st.markdown("## 📥 Content Input")
     st.markdown("Choose your content source and let's create SEO-optimized articles!")
     
-    # Initialize content extractor
-    if 'content_extractor' not in st.session_state:
-        st.session_state.content_extractor = ContentExtractor()
-    
     # Input source selection with improved UI
     col1, col2 = st.columns([2, 1])
     
@@ -340,7 +637,7 @@ def render_text_input():
     
     if st.button("🚀 Process Text Content", type="primary", disabled=not text_content):
         if text_content:
-            extractor = st.session_state.content_extractor
+            extractor = get_content_extractor()
             extracted_data = extractor.extract_from_text(text_content)
             st.session_state.current_content = extracted_data
             st.success("✅ Text content processed successfully!")
@@ -353,20 +650,17 @@ def render_url_input():
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        url_input = st.text_input(
-            "Article URL:",
-            placeholder="https://example.com/article",
-            key="url_input_field",
-            help="Enter the URL of the article you want to extract content from"
-        )
-        
-        # URL validation feedback
-        if url_input:
-            extractor = st.session_state.content_extractor
-            if extractor.is_valid_url(url_input):
-                st.success("✅ Valid URL format")
-            else:
-                st.error("❌ Invalid URL format")
+        # A form only reruns the script on submit, so typing a URL no longer re-renders the page
+        with st.form("url_input_form"):
+            url_input = st.text_area(
+                "Article URL(s):",
+                placeholder="https://example.com/article\nhttps://example.com/another-article",
+                height=100,
+                key="url_input_field",
+                help="Enter one article URL per line; several URLs are fetched together and combined into one source"
+            )
+            
+            extract_submitted = st.form_submit_button("📖 Extract Content", type="primary")
     
     with col2:
         st.markdown("#### 🎯 Supported Sites")
@@ -380,10 +674,37 @@ def render_url_input():
         st.markdown("#### ⚠️ Note")
         st.caption("Some sites may block automated access")
     
-    if st.button("📖 Extract Content", type="primary", disabled=not url_input):
-        if url_input:
-            extractor = st.session_state.content_extractor
-            success, result = extractor.extract_from_url(url_input)
+    if extract_submitted:
+        extractor = get_content_extractor()
+        
+        urls = [line.strip() for line in url_input.splitlines() if line.strip()]
+        invalid_urls = [url for url in urls if not extractor.is_valid_url(url)]
+        
+        # URL validation feedback, checked once per submit
+        if not urls:
+            st.warning("⚠️ Please enter an article URL.")
+        elif invalid_urls:
+            st.error(f"❌ Invalid URL format: {', '.join(invalid_urls)}")
+        elif len(urls) > 1:
+            # Fetch every page concurrently, then merge the ones that succeeded
+            with st.spinner(f"🔍 Extracting content from {len(urls)} URLs..."):
+                results = extractor.extract_from_urls(urls)
+            
+            articles = [data for success, data in results if success]
+            for url, (success, data) in zip(urls, results):
+                if not success:
+                    st.warning(f"⚠️ {url}: {data.get('error', 'Failed to extract content')}")
+            
+            if articles:
+                result = extractor.combine_articles(articles)
+                st.session_state.current_content = result
+                st.success(f"✅ Content extracted from {len(articles)} of {len(urls)} URLs! Found {result.get('word_count', 0)} words.")
+                if len(articles) == len(urls):
+                    st.rerun()
+            else:
+                st.error("❌ Failed to extract content from any of the URLs")
+        else:
+            success, result = extractor.extract_from_url(urls[0])
             
             if success:
                 st.session_state.current_content = result
@@ -469,8 +790,10 @@ def display_extracted_content():
             st.markdown("#### Content Preview:")
             st.text_area("", value=preview_text, height=200, disabled=True)
             
+            # Only send the full article to the browser while the toggle is on; unlike the old
+            # button it also stays open across reruns triggered elsewhere on the page
             if len(content_text) > 500:
-                if st.button("📖 Show Full Content"):
+                if st.toggle("📖 Show Full Content", key="show_full_content"):
                     st.markdown("#### Full Content:")
                     st.text_area("", value=content_text, height=400, disabled=True)
     
@@ -495,8 +818,9 @@ def display_extracted_content():
         if st.button("💾 Save Changes"):
             st.session_state.current_content['title'] = edited_title
             st.session_state.current_content['content'] = edited_content
-            st.session_state.current_content['word_count'] = len(edited_content.split())
-            st.session_state.current_content['reading_time'] = st.session_state.content_extractor.calculate_reading_time(edited_content)
+            word_count = len(edited_content.split())
+            st.session_state.current_content['word_count'] = word_count
+            st.session_state.current_content['reading_time'] = get_content_extractor()._reading_time_from_words(word_count)
             st.success("✅ Changes saved!")
             st.rerun()
     
@@ -1,12 +1,387 @@
 import streamlit as st
+import csv
 import json
 import re
 import base64
+import hashlib
 import zipfile
 import io
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
-import xml.etree.ElementTree as ET
+from functools import lru_cache
+from html import escape
+from string import Template, punctuation
+from typing import Dict, Iterator, List, Optional, Tuple, Any, BinaryIO, TextIO
+from lxml import etree
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, fall back to json
+    orjson = None
+
+try:
+    import cmarkgfm
+    from cmarkgfm.cmark import Options as CmarkOptions
+except ImportError:  # optional C renderer, fall back to the regex line scanner
+    cmarkgfm = None
+
+# Namespaces declared on the <rss> root of a WordPress eXtended RSS (WXR) export
+_WXR_NAMESPACES = {
+    "excerpt": "http://wordpress.org/export/1.2/excerpt/",
+    "content": "http://purl.org/rss/1.0/modules/content/",
+    "wfw": "http://wellformedweb.org/CommentAPI/",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "wp": "http://wordpress.org/export/1.2/"
+}
+
+def _wxr_tag(prefix: str, name: str) -> str:
+    """Qualified (Clark notation) tag name for a WXR namespace prefix"""
+    return f"{{{_WXR_NAMESPACES[prefix]}}}{name}"
+
+def _write_xml_element(xf, tag: str, text: str, attrib: Dict = None, cdata: bool = False) -> None:
+    """Write one text element to an lxml incremental writer"""
+    with xf.element(tag, attrib or {}):
+        # A CDATA section cannot contain its own terminator; such text is escaped instead
+        if cdata and ']]>' not in text:
+            xf.write(etree.CDATA(text))
+        elif text:
+            xf.write(text)
+
+# Single-pass str.translate tables: slugs turn spaces into dashes, hashtags drop them;
+# both drop punctuation other than "-" and "_"
+_SLUG_TABLE = str.maketrans({' ': '-', **{c: None for c in punctuation if c not in '-_'}})
+_HASHTAG_TABLE = str.maketrans({c: None for c in ' ' + punctuation if c != '_'})
+
+# Markdown heading and emphasis marks deleted for the plain-text download
+_PLAIN_TEXT_TABLE = str.maketrans('', '', '#*')
+
+def _slug(text: str) -> str:
+    """Lowercase, dash-separated slug such as a WordPress category nicename"""
+    return text.lower().translate(_SLUG_TABLE)
+
+def _hashtag(text: str) -> str:
+    """Keyword text with spaces and punctuation removed, ready to follow a '#'"""
+    return text.translate(_HASHTAG_TABLE)
+
+# Markdown export skeleton; each optional block carries its own trailing/leading blank lines
+_MD_DOCUMENT = "{title_block}{meta_block}{content}{footer_block}"
+
+# export_all formats whose exporters accept a precomputed article HTML body
+_HTML_EXPORTS = frozenset(['html', 'json', 'wordpress', 'medium', 'email'])
+
+# export_all formats whose exporters stamp the export time and accept a shared ctx
+_TIMESTAMPED_EXPORTS = frozenset(['markdown', 'html', 'json', 'wordpress'])
+
+# Page templates for the HTML, Medium and email exports; title and meta are HTML-escaped,
+# the other fields are pre-rendered HTML fragments
+_HTML_PAGE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title</title>
+    <meta name="description" content="$meta_desc">
+    $social_meta
+    $schema_markup
+    <style>
+        $css_style
+    </style>
+</head>
+<body>
+    <article class="main-content">
+        <header>
+            <h1>$title</h1>
+            $meta_in_content
+        </header>
+        
+        <main>
+            $html_content
+        </main>
+        
+        $footer
+    </article>
+</body>
+</html>""")
+
+_MEDIUM_PAGE = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>$title</title>
+    <meta name="description" content="$meta_desc">
+</head>
+<body>
+    <article>
+        <h1>$title</h1>
+        $subtitle
+        $medium_content
+    </article>
+</body>
+</html>""")
+
+_EMAIL_PAGE = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title</title>
+</head>
+<body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
+    
+    <header style="text-align: center; margin-bottom: 30px; border-bottom: 2px solid #eee; padding-bottom: 20px;">
+        <h1 style="color: #2c3e50; margin: 0;">$title</h1>
+        $subtitle
+    </header>
+    
+    <main style="margin-bottom: 30px;">
+        $email_content
+    </main>
+    
+    <footer style="border-top: 1px solid #eee; padding-top: 20px; text-align: center; color: #7f8c8d; font-size: 14px;">
+        <p>Generated by SEO Content Generator</p>
+        $reading_time
+    </footer>
+    
+</body>
+</html>""")
+
+# Stylesheets for the HTML export themes, keyed by theme name
+_CSS_STYLES = {
+    'modern': """
+                body {
+                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+                    line-height: 1.6;
+                    color: #333;
+                    max-width: 800px;
+                    margin: 0 auto;
+                    padding: 20px;
+                    background: #fff;
+                }
+                
+                .main-content {
+                    background: #fff;
+                    border-radius: 8px;
+                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+                    padding: 40px;
+                }
+                
+                h1 {
+                    color: #2c3e50;
+                    font-size: 2.5em;
+                    margin-bottom: 0.5em;
+                    border-bottom: 3px solid #3498db;
+                    padding-bottom: 0.3em;
+                }
+                
+                h2 {
+                    color: #34495e;
+                    font-size: 1.8em;
+                    margin-top: 2em;
+                    margin-bottom: 1em;
+                    border-left: 4px solid #3498db;
+                    padding-left: 15px;
+                }
+                
+                h3 {
+                    color: #34495e;
+                    font-size: 1.4em;
+                    margin-top: 1.5em;
+                    margin-bottom: 0.8em;
+                }
+                
+                p {
+                    margin-bottom: 1.2em;
+                    text-align: justify;
+                }
+                
+                ul, ol {
+                    margin-bottom: 1.2em;
+                    padding-left: 2em;
+                }
+                
+                li {
+                    margin-bottom: 0.5em;
+                }
+                
+                strong {
+                    color: #2c3e50;
+                    font-weight: 600;
+                }
+                
+                .meta-description {
+                    font-style: italic;
+                    color: #7f8c8d;
+                    font-size: 1.1em;
+                    margin-bottom: 2em;
+                    border-left: 3px solid #95a5a6;
+                    padding-left: 15px;
+                }
+                
+                .footer {
+                    margin-top: 3em;
+                    padding-top: 2em;
+                    border-top: 1px solid #ecf0f1;
+                    text-align: center;
+                    color: #7f8c8d;
+                    font-size: 0.9em;
+                }
+            """,
+
+    'minimal': """
+                body {
+                    font-family: Georgia, serif;
+                    line-height: 1.8;
+                    color: #333;
+                    max-width: 700px;
+                    margin: 0 auto;
+                    padding: 40px 20px;
+                }
+                
+                h1, h2, h3 {
+                    color: #000;
+                    font-weight: normal;
+                }
+                
+                h1 {
+                    font-size: 2.2em;
+                    margin-bottom: 1em;
+                }
+                
+                h2 {
+                    font-size: 1.6em;
+                    margin-top: 2em;
+                    margin-bottom: 1em;
+                }
+                
+                p {
+                    margin-bottom: 1.5em;
+                }
+            """,
+
+    'professional': """
+                body {
+                    font-family: 'Times New Roman', serif;
+                    line-height: 1.6;
+                    color: #000;
+                    max-width: 800px;
+                    margin: 0 auto;
+                    padding: 20px;
+                    background: #fff;
+                }
+                
+                h1 {
+                    font-size: 2.2em;
+                    text-align: center;
+                    margin-bottom: 1em;
+                    font-weight: bold;
+                }
+                
+                h2 {
+                    font-size: 1.5em;
+                    margin-top: 2em;
+                    margin-bottom: 1em;
+                    font-weight: bold;
+                }
+                
+                p {
+                    text-align: justify;
+                    margin-bottom: 1em;
+                }
+            """
+}
+
+def _dump_json(data) -> bytes:
+    """Serialize export data as UTF-8 JSON with 2-space indentation"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Deflate level for the text-only social package: level 1 is several times faster than
+# the default 6 and costs only a modest share of compression ratio on prose
+_ZIP_COMPRESSLEVEL = 1
+
+def _write_zip_member(zip_file: zipfile.ZipFile, name: str, data) -> None:
+    """Compress one member straight into the archive's underlying stream; str is UTF-8 encoded"""
+    with zip_file.open(name, 'w') as member:
+        member.write(data.encode('utf-8') if isinstance(data, str) else data)
+
+# Characters replaced with "_" in export filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\-_\.]')
+
+# Markdown clean-up: collapse blank-line runs and put a blank line around headings
+_EXCESS_NEWLINES = re.compile(r'\n{3,}')
+_BEFORE_HEADING = re.compile(r'\n(#{1,6}\s)')
+_AFTER_HEADING = re.compile(r'(#{1,6}\s.+)\n([^\n#])')
+
+# Markdown stripped from plain-text (LinkedIn) exports
+_MD_HEADER_MARK = re.compile(r'#{1,6}\s')
+_MD_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_MD_ITALIC = re.compile(r'\*(.+?)\*')
+
+# Line prefixes that mark a bullet point when extracting key points for social posts
+_BULLET_PREFIXES = frozenset(['• ', '- ', '* '])
+
+# Block-level markdown, matched once at the start of each line
+_MD_BLOCK = re.compile(r'(?P<hashes>#{1,4}) (?P<heading>.+)|[•\-\*] (?P<bullet>.+)|\d+\. (?P<number>.+)')
+_MD_LIST_TAGS = {'bullet': 'ul', 'number': 'ol'}
+
+# Generated articles use "• " bullets, which CommonMark does not treat as list markers
+_MD_DOT_BULLET = re.compile(r'^• ', re.MULTILINE)
+
+# Inline markdown in one left-to-right scan: bold before italic, then links
+_MD_INLINE = re.compile(r'\*\*(.+?)\*\*|\*(.+?)\*|\[(.+?)\]\((.+?)\)')
+
+def _md_inline_sub(match) -> str:
+    """Replacement for one _MD_INLINE match; nested markup inside it is converted too"""
+    bold, italic, link_text, href = match.groups()
+    if bold is not None:
+        return f'<strong>{_md_inline(bold)}</strong>'
+    if italic is not None:
+        return f'<em>{_md_inline(italic)}</em>'
+    return f'<a href="{href}">{_md_inline(link_text)}</a>'
+
+def _md_inline(text: str) -> str:
+    """Convert bold, italic and links in a line of markdown"""
+    return _MD_INLINE.sub(_md_inline_sub, text)
+
+def _md_paragraph(lines: List[str]) -> str:
+    """Wrap paragraph lines in <p>, leaving paragraphs that are already HTML alone"""
+    text = '\n'.join(lines)
+    return _md_inline(text) if text.startswith('<') else f'<p>{_md_inline(text)}</p>'
+
+def _md_list(tag: str, items: List[str]) -> str:
+    """Render consecutive list items as one <ul>/<ol>"""
+    return f"<{tag}>{''.join(f'<li>{_md_inline(item)}</li>' for item in items)}</{tag}>"
+
+def _markdown_blocks(markdown_content: str) -> Iterator[str]:
+    """Yield one HTML block per heading, list and paragraph, classifying each line once"""
+    paragraph, items, list_tag = [], [], None
+    
+    for line in markdown_content.splitlines():
+        match = _MD_BLOCK.match(line)
+        kind = match.lastgroup if match else ('text' if line.strip() else 'blank')
+        
+        # A line of another kind ends the open paragraph or list
+        if paragraph and kind != 'text':
+            yield _md_paragraph(paragraph)
+            paragraph = []
+        if items and _MD_LIST_TAGS.get(kind) != list_tag:
+            yield _md_list(list_tag, items)
+            items = []
+        
+        if kind == 'heading':
+            level = len(match.group('hashes'))
+            yield f"<h{level}>{_md_inline(match.group('heading'))}</h{level}>"
+        elif kind in _MD_LIST_TAGS:
+            list_tag = _MD_LIST_TAGS[kind]
+            items.append(match.group(kind))
+        elif kind == 'text':
+            paragraph.append(line.strip())
+    
+    if paragraph:
+        yield _md_paragraph(paragraph)
+    if items:
+        yield _md_list(list_tag, items)
 
 class DownloadManager:
     """Advanced download and export management system"""
@@ -38,17 +413,73 @@ class DownloadManager:
             'notion': 'Notion',
             'confluence': 'Confluence'
         }
+        
+        # Line and paragraph splits of the most recent article text, shared by the
+        # key-point, summary and thread builders
+        self._structure_cache: Dict[str, Tuple[List[str], List[str]]] = {}
+    
+    def _content_structure(self, text: str) -> Tuple[List[str], List[str]]:
+        """Return (lines, paragraphs) of article text, splitting each article only once"""
+        structure = self._structure_cache.get(text)
+        if structure is None:
+            structure = (text.split('\n'), text.split('\n\n'))
+            # Only the current article is kept, so stale articles do not accumulate
+            self._structure_cache.clear()
+            self._structure_cache[text] = structure
+        return structure
     
-    def generate_filename(self, content: Dict, format_type: str, custom_name: str = None) -> str:
+    def export_all(self, content: Dict, formats: List[str], options: Dict = None) -> Dict[str, Any]:
+        """Export content in several formats, converting the article body to HTML only once
+        
+        options maps a format name to the options for that format.
+        """
+        options = options or {}
+        ctx = self.export_context()
+        precomputed = {'html': self.markdown_to_html(content.get('content', ''))}
+        
+        exporters = {
+            'markdown': self.export_markdown,
+            'html': self.export_html,
+            'json': self.export_json,
+            'wordpress': self.export_wordpress,
+            'medium': self.export_medium,
+            'linkedin': self.export_linkedin,
+            'email': self.export_email_template,
+            'csv': self.export_analytics_csv
+        }
+        
+        exports = {}
+        for format_type in formats:
+            extra = {}
+            if format_type in _HTML_EXPORTS:
+                extra['precomputed'] = precomputed
+            if format_type in _TIMESTAMPED_EXPORTS:
+                extra['ctx'] = ctx
+            exports[format_type] = exporters[format_type](content, options.get(format_type), **extra)
+        
+        return exports
+    
+    def _article_html(self, content: Dict, precomputed: Dict = None) -> str:
+        """HTML for the article body, reusing a conversion done by export_all"""
+        if precomputed and 'html' in precomputed:
+            return precomputed['html']
+        return self.markdown_to_html(content.get('content', ''))
+    
+    def export_context(self) -> Dict:
+        """Read the clock once for an export, so every artifact and filename shares one timestamp"""
+        now = datetime.now()
+        return {'now': now, 'now_iso': now.isoformat()}
+    
+    def generate_filename(self, content: Dict, format_type: str, custom_name: str = None, ctx: Dict = None) -> str:
         """Generate appropriate filename for export"""
         if custom_name:
-            base_name = re.sub(r'[^\w\-_\.]', '_', custom_name)
+            base_name = _UNSAFE_FILENAME_CHARS.sub('_', custom_name)
         else:
             title = content.get('title', 'article')
-            base_name = re.sub(r'[^\w\-_\.]', '_', title.lower())
+            base_name = _UNSAFE_FILENAME_CHARS.sub('_', title.lower())
         
         # Add timestamp for uniqueness
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = (ctx or self.export_context())['now'].strftime('%Y%m%d_%H%M%S')
         
         extensions = {
             'markdown': '.md',
@@ -69,32 +500,27 @@ class DownloadManager:
         extension = extensions.get(format_type, '.txt')
         return f"{base_name}_{timestamp}{extension}"
     
-    def export_markdown(self, content: Dict, options: Dict = None) -> str:
+    def export_markdown(self, content: Dict, options: Dict = None, ctx: Dict = None) -> str:
         """Export content as Markdown with customizable options"""
         options = options or {}
         
-        markdown_content = []
-        
         # Title
         title = content.get('title', 'Untitled Article')
-        if options.get('include_title', True):
-            markdown_content.append(f"# {title}")
-            markdown_content.append("")
+        title_block = f"# {title}\n\n" if options.get('include_title', True) else ''
         
         # Meta information
+        meta_block = ''
         if options.get('include_meta', True):
             meta_desc = content.get('meta_description', '')
             if meta_desc:
-                markdown_content.append(f"**Meta Description:** {meta_desc}")
-                markdown_content.append("")
+                meta_block += f"**Meta Description:** {meta_desc}\n\n"
             
             # Add keywords if available
             primary_keyword = content.get('primary_keyword', '')
             secondary_keywords = content.get('secondary_keywords', [])
             if primary_keyword or secondary_keywords:
                 keywords = [primary_keyword] + secondary_keywords if primary_keyword else secondary_keywords
-                markdown_content.append(f"**Keywords:** {', '.join(keywords)}")
-                markdown_content.append("")
+                meta_block += f"**Keywords:** {', '.join(keywords)}\n\n"
         
         # Main content
         article_content = content.get('content', '')
@@ -102,33 +528,36 @@ class DownloadManager:
             # Clean up markdown formatting
             article_content = self.clean_markdown_content(article_content)
         
-        markdown_content.append(article_content)
-        
         # Footer information
+        footer_block = ''
         if options.get('include_footer', True):
-            markdown_content.append("")
-            markdown_content.append("---")
-            markdown_content.append("")
+            footer_block = "\n\n---\n"
             
-            generation_date = content.get('generated_at', datetime.now().isoformat())
+            ctx = ctx or self.export_context()
+            generation_date = content.get('generated_at', ctx['now_iso'])
             if generation_date:
                 try:
                     gen_date = datetime.fromisoformat(generation_date.replace('Z', '+00:00'))
                     formatted_date = gen_date.strftime('%B %d, %Y at %H:%M')
-                    markdown_content.append(f"*Generated on {formatted_date}*")
+                    footer_block += f"\n*Generated on {formatted_date}*"
                 except:
-                    markdown_content.append(f"*Generated on {generation_date}*")
+                    footer_block += f"\n*Generated on {generation_date}*"
             
             if options.get('include_seo_info', False):
                 seo_analysis = content.get('seo_analysis', {})
                 if seo_analysis:
                     score = seo_analysis.get('score', 0)
                     grade = seo_analysis.get('grade', 'N/A')
-                    markdown_content.append(f"*SEO Score: {score}/100 (Grade: {grade})*")
+                    footer_block += f"\n*SEO Score: {score}/100 (Grade: {grade})*"
         
-        return '\n'.join(markdown_content)
+        return _MD_DOCUMENT.format_map({
+            'title_block': title_block,
+            'meta_block': meta_block,
+            'content': article_content,
+            'footer_block': footer_block
+        })
     
-    def export_html(self, content: Dict, options: Dict = None) -> str:
+    def export_html(self, content: Dict, options: Dict = None, precomputed: Dict = None, ctx: Dict = None) -> str:
         """Export content as HTML with advanced formatting options"""
         options = options or {}
         
@@ -137,7 +566,7 @@ class DownloadManager:
         article_content = content.get('content', '')
         
         # Convert markdown to HTML
-        html_content = self.markdown_to_html(article_content)
+        html_content = self._article_html(content, precomputed)
         
         # CSS styling options
         css_style = self.get_html_css_style(options.get('style_theme', 'modern'))
@@ -147,48 +576,35 @@ class DownloadManager:
         if options.get('include_schema', True):
             schema_data = content.get('schema_markup', {})
             if schema_data:
-                schema_markup = f'<script type="application/ld+json">\n{json.dumps(schema_data, indent=2)}\n</script>'
+                schema_markup = f'<script type="application/ld+json">\n{_dump_json(schema_data).decode("utf-8")}\n</script>'
         
         # Social media meta tags
         social_meta = ""
         if options.get('include_social_meta', True):
             social_meta = self.generate_social_meta_tags(content)
         
-        # HTML template
-        html_template = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <meta name="description" content="{meta_desc}">
-    {social_meta}
-    {schema_markup}
-    <style>
-        {css_style}
-    </style>
-</head>
-<body>
-    <article class="main-content">
-        <header>
-            <h1>{title}</h1>
-            {f'<p class="meta-description">{meta_desc}</p>' if meta_desc and options.get('show_meta_in_content', False) else ''}
-        </header>
-        
-        <main>
-            {html_content}
-        </main>
-        
-        {self.generate_html_footer(content, options) if options.get('include_footer', True) else ''}
-    </article>
-</body>
-</html>"""
-        
-        return html_template
+        # Meta description shown under the title
+        meta_in_content = ""
+        if meta_desc and options.get('show_meta_in_content', False):
+            meta_in_content = f'<p class="meta-description">{escape(meta_desc)}</p>'
+        
+        footer = self.generate_html_footer(content, options, ctx) if options.get('include_footer', True) else ''
+        
+        return _HTML_PAGE.substitute(
+            title=escape(title),
+            meta_desc=escape(meta_desc),
+            social_meta=social_meta,
+            schema_markup=schema_markup,
+            css_style=css_style,
+            meta_in_content=meta_in_content,
+            html_content=html_content,
+            footer=footer
+        )
     
-    def export_json(self, content: Dict, options: Dict = None) -> str:
+    def export_json(self, content: Dict, options: Dict = None, precomputed: Dict = None, ctx: Dict = None) -> str:
         """Export content as structured JSON with metadata"""
         options = options or {}
+        ctx = ctx or self.export_context()
         
         export_data = {
             "metadata": {
@@ -198,11 +614,11 @@ class DownloadManager:
                 "secondary_keywords": content.get('secondary_keywords', []),
                 "word_count": content.get('word_count', 0),
                 "generated_at": content.get('generated_at', ''),
-                "exported_at": datetime.now().isoformat()
+                "exported_at": ctx['now_iso']
             },
             "content": {
                 "raw_content": content.get('content', ''),
-                "html_content": self.markdown_to_html(content.get('content', '')) if options.get('include_html', True) else None
+                "html_content": self._article_html(content, precomputed) if options.get('include_html', True) else None
             },
             "seo_data": content.get('seo_analysis', {}) if options.get('include_seo', True) else {},
             "settings_used": content.get('settings_used', {}) if options.get('include_settings', False) else {},
@@ -213,56 +629,52 @@ class DownloadManager:
         if options.get('clean_json', True):
             export_data = self.clean_json_data(export_data)
         
-        return json.dumps(export_data, indent=2, ensure_ascii=False)
+        return _dump_json(export_data).decode('utf-8')
     
-    def export_wordpress(self, content: Dict, options: Dict = None) -> str:
+    def export_wordpress(self, content: Dict, options: Dict = None, precomputed: Dict = None, ctx: Dict = None) -> str:
         """Export content as WordPress WXR format"""
         options = options or {}
+        ctx = ctx or self.export_context()
         
         title = content.get('title', 'Untitled Article')
         post_content = content.get('content', '')
         meta_desc = content.get('meta_description', '')
         
         # Convert markdown to HTML for WordPress
-        wp_content = self.markdown_to_html(post_content)
-        
-        # Generate WordPress XML
-        root = ET.Element("rss")
-        root.set("version", "2.0")
-        root.set("xmlns:excerpt", "http://wordpress.org/export/1.2/excerpt/")
-        root.set("xmlns:content", "http://purl.org/rss/1.0/modules/content/")
-        root.set("xmlns:wfw", "http://wellformedweb.org/CommentAPI/")
-        root.set("xmlns:dc", "http://purl.org/dc/elements/1.1/")
-        root.set("xmlns:wp", "http://wordpress.org/export/1.2/")
-        
-        channel = ET.SubElement(root, "channel")
-        
-        # Channel info
-        ET.SubElement(channel, "title").text = "SEO Content Generator Export"
-        ET.SubElement(channel, "description").text = "Generated content export"
-        ET.SubElement(channel, "wp:wxr_version").text = "1.2"
-        
-        # Post item
-        item = ET.SubElement(channel, "item")
-        ET.SubElement(item, "title").text = title
-        ET.SubElement(item, "dc:creator").text = options.get('author', 'SEO Content Generator')
-        ET.SubElement(item, "content:encoded").text = f"<![CDATA[{wp_content}]]>"
-        ET.SubElement(item, "excerpt:encoded").text = f"<![CDATA[{meta_desc}]]>"
-        ET.SubElement(item, "wp:post_type").text = "post"
-        ET.SubElement(item, "wp:status").text = "draft"
-        ET.SubElement(item, "wp:post_date").text = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Add categories/tags if specified
-        if options.get('categories'):
-            for category in options['categories']:
-                cat_elem = ET.SubElement(item, "category")
-                cat_elem.set("domain", "category")
-                cat_elem.set("nicename", category.lower().replace(' ', '-'))
-                cat_elem.text = category
-        
-        return ET.tostring(root, encoding='unicode', xml_declaration=True)
-    
-    def export_medium(self, content: Dict, options: Dict = None) -> str:
+        wp_content = self._article_html(content, precomputed)
+        
+        # Stream the WordPress XML; lxml writes CDATA sections natively and serializes in C
+        buffer = io.BytesIO()
+        with etree.xmlfile(buffer, encoding='UTF-8') as xf:
+            xf.write_declaration()
+            with xf.element("rss", {"version": "2.0"}, nsmap=_WXR_NAMESPACES):
+                with xf.element("channel"):
+                    
+                    # Channel info
+                    _write_xml_element(xf, "title", "SEO Content Generator Export")
+                    _write_xml_element(xf, "description", "Generated content export")
+                    _write_xml_element(xf, _wxr_tag("wp", "wxr_version"), "1.2")
+                    
+                    # Post item
+                    with xf.element("item"):
+                        _write_xml_element(xf, "title", title)
+                        _write_xml_element(xf, _wxr_tag("dc", "creator"), options.get('author', 'SEO Content Generator'))
+                        _write_xml_element(xf, _wxr_tag("content", "encoded"), wp_content, cdata=True)
+                        _write_xml_element(xf, _wxr_tag("excerpt", "encoded"), meta_desc, cdata=True)
+                        _write_xml_element(xf, _wxr_tag("wp", "post_type"), "post")
+                        _write_xml_element(xf, _wxr_tag("wp", "status"), "draft")
+                        _write_xml_element(xf, _wxr_tag("wp", "post_date"), ctx['now'].strftime('%Y-%m-%d %H:%M:%S'))
+                        
+                        # Add categories/tags if specified
+                        for category in options.get('categories') or ():
+                            _write_xml_element(xf, "category", category, {
+                                "domain": "category",
+                                "nicename": _slug(category)
+                            })
+        
+        return buffer.getvalue().decode('utf-8')
+    
+    def export_medium(self, content: Dict, options: Dict = None, precomputed: Dict = None) -> str:
         """Export content formatted for Medium import"""
         options = options or {}
         
@@ -271,25 +683,16 @@ class DownloadManager:
         meta_desc = content.get('meta_description', '')
         
         # Medium-specific HTML formatting
-        medium_content = self.format_for_medium(article_content)
+        medium_content = self.format_for_medium(article_content, self._article_html(content, precomputed))
         
-        html_template = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>{title}</title>
-    <meta name="description" content="{meta_desc}">
-</head>
-<body>
-    <article>
-        <h1>{title}</h1>
-        {f'<p><em>{meta_desc}</em></p>' if meta_desc and options.get('include_subtitle', True) else ''}
-        {medium_content}
-    </article>
-</body>
-</html>"""
+        subtitle = f'<p><em>{escape(meta_desc)}</em></p>' if meta_desc and options.get('include_subtitle', True) else ''
         
-        return html_template
+        return _MEDIUM_PAGE.substitute(
+            title=escape(title),
+            meta_desc=escape(meta_desc),
+            subtitle=subtitle,
+            medium_content=medium_content
+        )
     
     def export_linkedin(self, content: Dict, options: Dict = None) -> str:
         """Export content formatted for LinkedIn articles"""
@@ -311,44 +714,41 @@ class DownloadManager:
         
         return output
     
-    def export_social_media_package(self, content: Dict, options: Dict = None) -> bytes:
-        """Export a complete social media package as ZIP file"""
+    def export_social_media_package(self, content: Dict, out_stream: BinaryIO, options: Dict = None,
+                                    ctx: Dict = None) -> None:
+        """Write a complete social media package as a ZIP archive to a writable binary stream"""
         options = options or {}
+        ctx = ctx or self.export_context()
         
-        zip_buffer = io.BytesIO()
-        
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        with zipfile.ZipFile(out_stream, 'w', zipfile.ZIP_DEFLATED, compresslevel=_ZIP_COMPRESSLEVEL) as zip_file:
             
             # Main article content
-            markdown_content = self.export_markdown(content, {'include_footer': False})
-            zip_file.writestr("article.md", markdown_content)
+            _write_zip_member(zip_file, "article.md", self.export_markdown(content, {'include_footer': False}, ctx))
             
             # Social media posts
             social_posts = self.generate_social_media_posts(content)
             
             # Twitter threads
             if 'twitter' in social_posts:
-                zip_file.writestr("twitter_thread.txt", social_posts['twitter'])
+                _write_zip_member(zip_file, "twitter_thread.txt", social_posts['twitter'])
             
             # Facebook post
             if 'facebook' in social_posts:
-                zip_file.writestr("facebook_post.txt", social_posts['facebook'])
+                _write_zip_member(zip_file, "facebook_post.txt", social_posts['facebook'])
             
             # LinkedIn post
             if 'linkedin' in social_posts:
-                zip_file.writestr("linkedin_post.txt", social_posts['linkedin'])
+                _write_zip_member(zip_file, "linkedin_post.txt", social_posts['linkedin'])
             
             # Instagram caption
             if 'instagram' in social_posts:
-                zip_file.writestr("instagram_caption.txt", social_posts['instagram'])
+                _write_zip_member(zip_file, "instagram_caption.txt", social_posts['instagram'])
             
             # Email newsletter version
-            email_content = self.export_email_template(content)
-            zip_file.writestr("email_newsletter.html", email_content)
+            _write_zip_member(zip_file, "email_newsletter.html", self.export_email_template(content))
             
             # Summary/excerpt
-            summary = self.generate_content_summary(content, max_words=150)
-            zip_file.writestr("summary.txt", summary)
+            _write_zip_member(zip_file, "summary.txt", self.generate_content_summary(content, max_words=150))
             
             # Metadata file
             metadata = {
@@ -357,14 +757,11 @@ class DownloadManager:
                 "reading_time": max(1, round(content.get('word_count', 0) / 225)),
                 "primary_keyword": content.get('primary_keyword', ''),
                 "generated_at": content.get('generated_at', ''),
-                "exported_at": datetime.now().isoformat()
+                "exported_at": ctx['now_iso']
             }
-            zip_file.writestr("metadata.json", json.dumps(metadata, indent=2))
-        
-        zip_buffer.seek(0)
-        return zip_buffer.getvalue()
+            _write_zip_member(zip_file, "metadata.json", _dump_json(metadata))
     
-    def export_email_template(self, content: Dict, options: Dict = None) -> str:
+    def export_email_template(self, content: Dict, options: Dict = None, precomputed: Dict = None) -> str:
         """Export content as email newsletter template"""
         options = options or {}
         
@@ -373,281 +770,96 @@ class DownloadManager:
         meta_desc = content.get('meta_description', '')
         
         # Convert to email-friendly HTML
-        email_content = self.format_for_email(article_content)
+        email_content = self.format_for_email(article_content, self._article_html(content, precomputed))
         
-        # Email template with inline CSS
-        email_template = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-</head>
-<body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-    
-    <header style="text-align: center; margin-bottom: 30px; border-bottom: 2px solid #eee; padding-bottom: 20px;">
-        <h1 style="color: #2c3e50; margin: 0;">{title}</h1>
-        {f'<p style="color: #7f8c8d; font-style: italic; margin: 10px 0 0 0;">{meta_desc}</p>' if meta_desc else ''}
-    </header>
-    
-    <main style="margin-bottom: 30px;">
-        {email_content}
-    </main>
-    
-    <footer style="border-top: 1px solid #eee; padding-top: 20px; text-align: center; color: #7f8c8d; font-size: 14px;">
-        <p>Generated by SEO Content Generator</p>
-        {f'<p>Reading time: {max(1, round(content.get("word_count", 0) / 225))} minutes</p>' if content.get('word_count') else ''}
-    </footer>
-    
-</body>
-</html>"""
+        subtitle = ""
+        if meta_desc:
+            subtitle = f'<p style="color: #7f8c8d; font-style: italic; margin: 10px 0 0 0;">{escape(meta_desc)}</p>'
         
-        return email_template
+        reading_time = ""
+        if content.get('word_count'):
+            reading_time = f'<p>Reading time: {max(1, round(content["word_count"] / 225))} minutes</p>'
+        
+        return _EMAIL_PAGE.substitute(
+            title=escape(title),
+            subtitle=subtitle,
+            email_content=email_content,
+            reading_time=reading_time
+        )
     
     def export_analytics_csv(self, content: Dict, options: Dict = None) -> str:
         """Export content analytics as CSV"""
-        options = options or {}
-        
+        buffer = io.StringIO()
+        self.export_analytics_csv_stream(content, buffer, options)
+        return buffer.getvalue()
+    
+    def export_analytics_csv_stream(self, content: Dict, out_stream: TextIO, options: Dict = None) -> None:
+        """Write content analytics as CSV rows to a text stream; the csv module handles quoting"""
+        writer = csv.writer(out_stream, quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+        writer.writerow(("Metric", "Value", "Description"))
+        writer.writerows(self._analytics_rows(content))
+    
+    def _analytics_rows(self, content: Dict) -> Iterator[Tuple]:
+        """Yield (metric, value, description) rows for the analytics CSV"""
         seo_analysis = content.get('seo_analysis', {})
         
-        csv_lines = [
-            "Metric,Value,Description"
-        ]
-        
         # Basic metrics
-        csv_lines.extend([
-            f"Title,\"{content.get('title', '')}\",Article title",
-            f"Word Count,{content.get('word_count', 0)},Total words in content",
-            f"Reading Time,{max(1, round(content.get('word_count', 0) / 225))},Estimated reading time in minutes",
-            f"Generated Date,{content.get('generated_at', '')},Content generation timestamp"
-        ])
+        yield "Title", content.get('title', ''), "Article title"
+        yield "Word Count", content.get('word_count', 0), "Total words in content"
+        yield "Reading Time", max(1, round(content.get('word_count', 0) / 225)), "Estimated reading time in minutes"
+        yield "Generated Date", content.get('generated_at', ''), "Content generation timestamp"
         
         # SEO metrics
         if seo_analysis:
-            csv_lines.extend([
-                f"SEO Score,{seo_analysis.get('score', 0)},Overall SEO score (0-100)",
-                f"SEO Grade,{seo_analysis.get('grade', 'N/A')},SEO letter grade",
-                f"Keyword Density,{seo_analysis.get('keyword_density', 0):.1f}%,Primary keyword density",
-                f"H2 Count,{seo_analysis.get('h2_count', 0)},Number of H2 headings"
-            ])
+            yield "SEO Score", seo_analysis.get('score', 0), "Overall SEO score (0-100)"
+            yield "SEO Grade", seo_analysis.get('grade', 'N/A'), "SEO letter grade"
+            yield "Keyword Density", f"{seo_analysis.get('keyword_density', 0):.1f}%", "Primary keyword density"
+            yield "H2 Count", seo_analysis.get('h2_count', 0), "Number of H2 headings"
         
         # Keywords
         primary_keyword = content.get('primary_keyword', '')
         secondary_keywords = content.get('secondary_keywords', [])
         
         if primary_keyword:
-            csv_lines.append(f"Primary Keyword,\"{primary_keyword}\",Main target keyword")
+            yield "Primary Keyword", primary_keyword, "Main target keyword"
         
         if secondary_keywords:
-            csv_lines.append(f"Secondary Keywords,\"{'; '.join(secondary_keywords)}\",Additional target keywords")
-        
-        return '\n'.join(csv_lines)
+            yield "Secondary Keywords", '; '.join(secondary_keywords), "Additional target keywords"
     
     def clean_markdown_content(self, content: str) -> str:
         """Clean and optimize markdown content"""
         # Remove excessive whitespace
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = _EXCESS_NEWLINES.sub('\n\n', content)
         
         # Ensure proper heading spacing
-        content = re.sub(r'\n(#{1,6}\s)', r'\n\n\1', content)
-        content = re.sub(r'(#{1,6}\s.+)\n([^\n#])', r'\1\n\n\2', content)
-        
-        # Clean up list formatting
-        content = re.sub(r'\n([•\-\*]\s)', r'\n\1', content)
-        content = re.sub(r'\n(\d+\.\s)', r'\n\1', content)
+        content = _BEFORE_HEADING.sub(r'\n\n\1', content)
+        content = _AFTER_HEADING.sub(r'\1\n\n\2', content)
         
         return content.strip()
     
-    def markdown_to_html(self, markdown_content: str) -> str:
-        """Convert markdown content to HTML"""
-        html_content = markdown_content
-        
-        # Headers
-        html_content = re.sub(r'^#### (.+)$', r'<h4>\1</h4>', html_content, flags=re.MULTILINE)
-        html_content = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html_content, flags=re.MULTILINE)
-        html_content = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html_content, flags=re.MULTILINE)
-        html_content = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html_content, flags=re.MULTILINE)
-        
-        # Bold and italic
-        html_content = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html_content)
-        html_content = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html_content)
-        
-        # Links
-        html_content = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2">\1</a>', html_content)
-        
-        # Bullet points
-        html_content = re.sub(r'^[•\-\*] (.+)$', r'<li>\1</li>', html_content, flags=re.MULTILINE)
-        html_content = re.sub(r'(<li>.*</li>)', r'<ul>\1</ul>', html_content, flags=re.DOTALL)
-        html_content = re.sub(r'</li>\n<li>', r'</li><li>', html_content)
-        
-        # Numbered lists
-        html_content = re.sub(r'^\d+\. (.+)$', r'<li>\1</li>', html_content, flags=re.MULTILINE)
-        
-        # Paragraphs
-        paragraphs = html_content.split('\n\n')
-        formatted_paragraphs = []
-        
-        for para in paragraphs:
-            para = para.strip()
-            if para and not para.startswith('<'):
-                para = f'<p>{para}</p>'
-            formatted_paragraphs.append(para)
+    # Every export format renders the same article body; keep recent conversions so
+    # export_html, export_json, export_wordpress, medium and email convert it once
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def markdown_to_html(markdown_content: str) -> str:
+        """Convert markdown content to HTML with cmark-gfm, or in a single pass over its lines"""
+        if cmarkgfm is not None:
+            # UNSAFE keeps raw HTML in the article, as the line scanner does
+            return cmarkgfm.github_flavored_markdown_to_html(
+                _MD_DOT_BULLET.sub('- ', markdown_content), options=CmarkOptions.CMARK_OPT_UNSAFE
+            )
         
-        return '\n\n'.join(formatted_paragraphs)
+        return '\n\n'.join(_markdown_blocks(markdown_content))
     
-    def get_html_css_style(self, theme: str = 'modern') -> str:
+    @staticmethod
+    def get_html_css_style(theme: str = 'modern') -> str:
         """Get CSS styles for HTML export"""
-        
-        styles = {
-            'modern': """
-                body {
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    background: #fff;
-                }
-                
-                .main-content {
-                    background: #fff;
-                    border-radius: 8px;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                    padding: 40px;
-                }
-                
-                h1 {
-                    color: #2c3e50;
-                    font-size: 2.5em;
-                    margin-bottom: 0.5em;
-                    border-bottom: 3px solid #3498db;
-                    padding-bottom: 0.3em;
-                }
-                
-                h2 {
-                    color: #34495e;
-                    font-size: 1.8em;
-                    margin-top: 2em;
-                    margin-bottom: 1em;
-                    border-left: 4px solid #3498db;
-                    padding-left: 15px;
-                }
-                
-                h3 {
-                    color: #34495e;
-                    font-size: 1.4em;
-                    margin-top: 1.5em;
-                    margin-bottom: 0.8em;
-                }
-                
-                p {
-                    margin-bottom: 1.2em;
-                    text-align: justify;
-                }
-                
-                ul, ol {
-                    margin-bottom: 1.2em;
-                    padding-left: 2em;
-                }
-                
-                li {
-                    margin-bottom: 0.5em;
-                }
-                
-                strong {
-                    color: #2c3e50;
-                    font-weight: 600;
-                }
-                
-                .meta-description {
-                    font-style: italic;
-                    color: #7f8c8d;
-                    font-size: 1.1em;
-                    margin-bottom: 2em;
-                    border-left: 3px solid #95a5a6;
-                    padding-left: 15px;
-                }
-                
-                .footer {
-                    margin-top: 3em;
-                    padding-top: 2em;
-                    border-top: 1px solid #ecf0f1;
-                    text-align: center;
-                    color: #7f8c8d;
-                    font-size: 0.9em;
-                }
-            """,
-            
-            'minimal': """
-                body {
-                    font-family: Georgia, serif;
-                    line-height: 1.8;
-                    color: #333;
-                    max-width: 700px;
-                    margin: 0 auto;
-                    padding: 40px 20px;
-                }
-                
-                h1, h2, h3 {
-                    color: #000;
-                    font-weight: normal;
-                }
-                
-                h1 {
-                    font-size: 2.2em;
-                    margin-bottom: 1em;
-                }
-                
-                h2 {
-                    font-size: 1.6em;
-                    margin-top: 2em;
-                    margin-bottom: 1em;
-                }
-                
-                p {
-                    margin-bottom: 1.5em;
-                }
-            """,
-            
-            'professional': """
-                body {
-                    font-family: 'Times New Roman', serif;
-                    line-height: 1.6;
-                    color: #000;
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    background: #fff;
-                }
-                
-                h1 {
-                    font-size: 2.2em;
-                    text-align: center;
-                    margin-bottom: 1em;
-                    font-weight: bold;
-                }
-                
-                h2 {
-                    font-size: 1.5em;
-                    margin-top: 2em;
-                    margin-bottom: 1em;
-                    font-weight: bold;
-                }
-                
-                p {
-                    text-align: justify;
-                    margin-bottom: 1em;
-                }
-            """
-        }
-        
-        return styles.get(theme, styles['modern'])
+        return _CSS_STYLES.get(theme, _CSS_STYLES['modern'])
     
     def generate_social_meta_tags(self, content: Dict) -> str:
         """Generate social media meta tags"""
-        title = content.get('title', '')
-        description = content.get('meta_description', '')
+        title = escape(content.get('title', ''))
+        description = escape(content.get('meta_description', ''))
         
         meta_tags = f"""
     <!-- Open Graph / Facebook -->
@@ -663,12 +875,13 @@ class DownloadManager:
         
         return meta_tags.strip()
     
-    def generate_html_footer(self, content: Dict, options: Dict) -> str:
+    def generate_html_footer(self, content: Dict, options: Dict, ctx: Dict = None) -> str:
         """Generate HTML footer"""
         footer_items = []
         
         if options.get('include_generation_date', True):
-            gen_date = content.get('generated_at', datetime.now().isoformat())
+            ctx = ctx or self.export_context()
+            gen_date = content.get('generated_at', ctx['now_iso'])
             try:
                 date_obj = datetime.fromisoformat(gen_date.replace('Z', '+00:00'))
                 formatted_date = date_obj.strftime('%B %d, %Y')
@@ -692,10 +905,10 @@ class DownloadManager:
         
         return f'<footer class="footer"><p>{footer_content}</p></footer>' if footer_content else ''
     
-    def format_for_medium(self, content: str) -> str:
+    def format_for_medium(self, content: str, html_content: str = None) -> str:
         """Format content specifically for Medium platform"""
         # Medium prefers certain formatting
-        formatted = self.markdown_to_html(content)
+        formatted = html_content if html_content is not None else self.markdown_to_html(content)
         
         # Medium-specific adjustments
         formatted = formatted.replace('<h1>', '<h2>')  # Medium uses h1 for title
@@ -706,19 +919,24 @@ class DownloadManager:
     def format_for_linkedin(self, content: str, max_length: int = 3000) -> str:
         """Format content for LinkedIn with length restrictions"""
         # Convert to plain text
-        text_content = re.sub(r'#{1,6}\s', '', content)  # Remove markdown headers
-        text_content = re.sub(r'\*\*(.+?)\*\*', r'\1', text_content)  # Remove bold
-        text_content = re.sub(r'\*(.+?)\*', r'\1', text_content)  # Remove italic
+        text_content = _MD_HEADER_MARK.sub('', content)  # Remove markdown headers
+        text_content = _MD_BOLD.sub(r'\1', text_content)  # Remove bold
+        text_content = _MD_ITALIC.sub(r'\1', text_content)  # Remove italic
         
-        # Truncate if too long
+        # Truncate if too long, backing up to the last word break that leaves room for "..."
         if len(text_content) > max_length:
-            text_content = text_content[:max_length-3] + "..."
+            cut = max_length - 3
+            boundary = max(text_content.rfind(' ', 0, cut + 1), text_content.rfind('\n', 0, cut + 1))
+            if boundary > 0:
+                cut = boundary
+            text_content = text_content[:cut].rstrip() + "..."
         
         return text_content
     
-    def format_for_email(self, content: str) -> str:
+    def format_for_email(self, content: str, html_content: str = None) -> str:
         """Format content for email with inline styles"""
-        html_content = self.markdown_to_html(content)
+        if html_content is None:
+            html_content = self.markdown_to_html(content)
         
         # Add inline styles for email compatibility
         html_content = html_content.replace('<h2>', '<h2 style="color: #2c3e50; margin-top: 30px; margin-bottom: 15px;">')
@@ -747,7 +965,7 @@ class DownloadManager:
         facebook_post = f"{title}\n\n{meta_desc}\n\n"
         facebook_post += self.generate_content_summary(content, max_words=100)
         if primary_keyword:
-            facebook_post += f"\n\n#{primary_keyword.replace(' ', '')}"
+            facebook_post += f"\n\n#{_hashtag(primary_keyword)}"
         posts['facebook'] = facebook_post
         
         # LinkedIn post (professional format)
@@ -767,40 +985,40 @@ class DownloadManager:
     
     def create_twitter_thread(self, title: str, description: str, content: str) -> str:
         """Create a Twitter thread from content"""
-        tweets = []
-        
-        # First tweet - hook
-        tweet1 = f"🧵 {title}\n\n{description[:200]}..."
-        tweets.append(f"1/{len(tweets)+3} {tweet1}")
-        
-        # Extract key points for subsequent tweets
+        # Extract key points for the middle tweets
         key_points = self.extract_key_points(content, max_points=5)
+        points = [point.strip()[:250] for point in key_points.split('\n')[:4] if point.strip()]
         
-        for i, point in enumerate(key_points.split('\n')[:4], 2):
-            if point.strip():
-                tweet = f"{i}/{len(tweets)+2} {point.strip()[:250]}"
-                tweets.append(tweet)
-        
-        # Final tweet - CTA
-        final_tweet = f"{len(tweets)+1}/{len(tweets)+1} What do you think about this? Share your thoughts below! 👇"
-        tweets.append(final_tweet)
+        # Hook, one tweet per key point, then the call to action
+        total = len(points) + 2
+        tweets = [f"1/{total} 🧵 {title}\n\n{description[:200]}..."]
+        tweets.extend(f"{i}/{total} {point}" for i, point in enumerate(points, 2))
+        tweets.append(f"{total}/{total} What do you think about this? Share your thoughts below! 👇")
         
         return '\n\n---\n\n'.join(tweets)
     
     def extract_key_points(self, content: str, max_points: int = 5) -> str:
         """Extract key points from content"""
-        # Look for bullet points or numbered lists first
-        bullet_points = re.findall(r'^[•\-\*] (.+), content, re.MULTILINE)
+        # One scan collects bullet points (preferred) and headings, stopping once
+        # enough bullets are found
+        lines, paragraphs = self._content_structure(content)
+        bullet_points, headings = [], []
+        for line in lines:
+            if line[:2] in _BULLET_PREFIXES and len(line) > 2:
+                bullet_points.append(line[2:])
+                if len(bullet_points) >= max_points:
+                    break
+            elif line.startswith('## ') and len(line) > 3 and len(headings) < max_points:
+                headings.append(line[3:])
+        
         if bullet_points:
-            return '\n'.join([f"• {point}" for point in bullet_points[:max_points]])
+            return '\n'.join(f"• {point}" for point in bullet_points[:max_points])
         
         # Extract from headings
-        headings = re.findall(r'^## (.+), content, re.MULTILINE)
         if headings:
-            return '\n'.join([f"• {heading}" for heading in headings[:max_points]])
+            return '\n'.join(f"• {heading}" for heading in headings)
         
         # Extract from paragraphs (simplified)
-        paragraphs = content.split('\n\n')
         key_sentences = []
         
         for para in paragraphs[:max_points]:
@@ -811,18 +1029,19 @@ class DownloadManager:
         return '\n'.join(key_sentences[:max_points])
     
     def generate_hashtags(self, content: Dict) -> List[str]:
-        """Generate relevant hashtags from content"""
-        hashtags = []
+        """Generate relevant hashtags from content, without repeats"""
+        # Dict keys act as an insertion-ordered set, so overlapping keywords are kept once
+        hashtags = {}
         
         # From primary keyword
         primary_keyword = content.get('primary_keyword', '')
         if primary_keyword:
-            hashtags.append(f"#{primary_keyword.replace(' ', '')}")
+            hashtags[f"#{_hashtag(primary_keyword)}"] = None
         
         # From secondary keywords
         secondary_keywords = content.get('secondary_keywords', [])
         for keyword in secondary_keywords[:3]:
-            hashtags.append(f"#{keyword.replace(' ', '')}")
+            hashtags[f"#{_hashtag(keyword)}"] = None
         
         # Content type hashtags
         content_type = content.get('content_type', '')
@@ -834,19 +1053,19 @@ class DownloadManager:
         }
         
         if content_type in type_hashtags:
-            hashtags.extend(type_hashtags[content_type])
+            hashtags.update(dict.fromkeys(type_hashtags[content_type]))
         
         # General hashtags
-        hashtags.extend(['#SEO', '#contentmarketing'])
+        hashtags.update(dict.fromkeys(['#SEO', '#contentmarketing']))
         
-        return hashtags[:15]  # Reasonable limit
+        return list(hashtags)[:15]  # Reasonable limit
     
     def generate_content_summary(self, content: Dict, max_words: int = 150) -> str:
         """Generate a concise summary of the content"""
         full_content = content.get('content', '')
         
         # Extract first paragraph or introduction
-        paragraphs = full_content.split('\n\n')
+        paragraphs = self._content_structure(full_content)[1]
         
         for para in paragraphs:
             if len(para.split()) > 20:  # Skip very short paragraphs
@@ -866,13 +1085,60 @@ class DownloadManager:
         return f"An in-depth article about {title.lower()}."
     
     def clean_json_data(self, data: Any) -> Any:
-        """Recursively remove None values from JSON data"""
-        if isinstance(data, dict):
-            return {k: self.clean_json_data(v) for k, v in data.items() if v is not None}
-        elif isinstance(data, list):
-            return [self.clean_json_data(item) for item in data if item is not None]
-        else:
+        """Remove None values from nested JSON data, walking it with an explicit stack
+        
+        Each cleaned container is attached to its parent before it is filled, so key and
+        item order are preserved without recursion.
+        """
+        if not isinstance(data, (dict, list)):
             return data
+        
+        cleaned = {} if isinstance(data, dict) else []
+        stack = [(data, cleaned)]
+        while stack:
+            source, target = stack.pop()
+            items = source.items() if isinstance(source, dict) else enumerate(source)
+            for key, value in items:
+                if value is None:
+                    continue
+                if isinstance(value, (dict, list)):
+                    child = {} if isinstance(value, dict) else []
+                    stack.append((value, child))
+                    value = child
+                if isinstance(target, dict):
+                    target[key] = value
+                else:
+                    target.append(value)
+        
+        return cleaned
+
+# Article fields the cached exports read besides the body; seo_analysis contributes only its
+# headline numbers, since detailed_analysis is large and never exported
+_CONTENT_KEY_FIELDS = (
+    'title', 'meta_description', 'primary_keyword', 'secondary_keywords',
+    'content_type', 'word_count', 'generated_at'
+)
+
+def _content_key(content: Dict) -> str:
+    """Short fingerprint of an article's exported fields, used to key Streamlit data caches"""
+    seo_analysis = content.get('seo_analysis') or {}
+    digest = hashlib.blake2b(content.get('content', '').encode('utf-8'), digest_size=8)
+    digest.update(repr((
+        tuple(content.get(field) for field in _CONTENT_KEY_FIELDS),
+        seo_analysis.get('score'), seo_analysis.get('grade'), seo_analysis.get('keyword_density')
+    )).encode('utf-8'))
+    return digest.hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_social_posts(content_key: str, _download_manager: DownloadManager, _content: Dict) -> Dict[str, str]:
+    """Social posts for one version of an article; unhashed arguments are identified by content_key"""
+    return _download_manager.generate_social_media_posts(_content)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_export(content_key: str, format_type: str, options: Dict,
+                   _download_manager: DownloadManager, _content: Dict) -> str:
+    """One export_<format_type> rendering of an article version, rebuilt only when it or options change"""
+    return getattr(_download_manager, f'export_{format_type}')(_content, options)
 
 def render_download_interface():
     """Render the comprehensive download and export interface"""
@@ -917,6 +1183,12 @@ def render_document_formats(download_manager: DownloadManager, content: Dict):
     st.markdown("### 📄 Document Formats")
     st.markdown("Download your content in various document formats for different uses.")
     
+    # One timestamp for every filename on this tab; exports are built when their download
+    # is clicked or their preview is shown, and served from the data cache until the
+    # article or their options change
+    ctx = download_manager.export_context()
+    content_key = _content_key(content)
+    
     col1, col2 = st.columns(2)
     
     with col1:
@@ -936,24 +1208,22 @@ def render_document_formats(download_manager: DownloadManager, content: Dict):
             'include_seo_info': md_include_seo
         }
         
-        markdown_content = download_manager.export_markdown(content, md_options)
-        filename = download_manager.generate_filename(content, 'markdown')
+        filename = download_manager.generate_filename(content, 'markdown', ctx=ctx)
         
         st.download_button(
             "📝 Download Markdown",
-            data=markdown_content,
+            data=lambda: _cached_export(content_key, 'markdown', md_options, download_manager, content),
             file_name=filename,
             mime="text/markdown",
             use_container_width=True
         )
         
         # Plain text export
-        plain_text = content.get('content', '').replace('#', '').replace('*', '')
-        txt_filename = download_manager.generate_filename(content, 'txt')
+        txt_filename = download_manager.generate_filename(content, 'txt', ctx=ctx)
         
         st.download_button(
             "📄 Download Plain Text",
-            data=plain_text,
+            data=lambda: content.get('content', '').translate(_PLAIN_TEXT_TABLE),
             file_name=txt_filename,
             mime="text/plain",
             use_container_width=True
@@ -978,28 +1248,27 @@ def render_document_formats(download_manager: DownloadManager, content: Dict):
             'show_meta_in_content': html_show_meta
         }
         
-        html_content = download_manager.export_html(content, html_options)
-        html_filename = download_manager.generate_filename(content, 'html')
+        html_filename = download_manager.generate_filename(content, 'html', ctx=ctx)
         
         st.download_button(
             "🌐 Download HTML",
-            data=html_content,
+            data=lambda: _cached_export(content_key, 'html', html_options, download_manager, content),
             file_name=html_filename,
             mime="text/html",
             use_container_width=True
         )
         
         # PDF-ready HTML
-        pdf_html = download_manager.export_html(content, {
+        pdf_options = {
             'style_theme': 'professional',
             'include_schema': False,
             'include_social_meta': False
-        })
-        pdf_filename = download_manager.generate_filename(content, 'pdf_ready')
+        }
+        pdf_filename = download_manager.generate_filename(content, 'pdf_ready', ctx=ctx)
         
         st.download_button(
             "📄 Download PDF-Ready HTML",
-            data=pdf_html,
+            data=lambda: _cached_export(content_key, 'html', pdf_options, download_manager, content),
             file_name=pdf_filename,
             mime="text/html",
             use_container_width=True,
@@ -1013,10 +1282,12 @@ def render_document_formats(download_manager: DownloadManager, content: Dict):
     
     if preview_format == 'Markdown':
         with st.expander("📋 Markdown Preview"):
+            markdown_content = _cached_export(content_key, 'markdown', md_options, download_manager, content)
             st.code(markdown_content[:1000] + "..." if len(markdown_content) > 1000 else markdown_content, language="markdown")
     
     else:  # HTML
         with st.expander("🌐 HTML Preview"):
+            html_content = _cached_export(content_key, 'html', html_options, download_manager, content)
             st.components.v1.html(html_content[:2000] + "..." if len(html_content) > 2000 else html_content, height=400, scrolling=True)
 
 def render_publishing_platforms(download_manager: DownloadManager, content: Dict):
@@ -1024,6 +1295,10 @@ def render_publishing_platforms(download_manager: DownloadManager, content: Dict
     st.markdown("### 🌐 Publishing Platforms")
     st.markdown("Export content optimized for specific publishing platforms.")
     
+    # One timestamp for every filename and export on this tab; each export is built only
+    # when its download is clicked
+    ctx = download_manager.export_context()
+    
     platform_col1, platform_col2 = st.columns(2)
     
     with platform_col1:
@@ -1039,12 +1314,11 @@ def render_publishing_platforms(download_manager: DownloadManager, content: Dict
             'categories': [cat.strip() for cat in wp_categories.split(',') if cat.strip()]
         }
         
-        wp_content = download_manager.export_wordpress(content, wp_options)
-        wp_filename = download_manager.generate_filename(content, 'wordpress')
+        wp_filename = download_manager.generate_filename(content, 'wordpress', ctx=ctx)
         
         st.download_button(
             "📱 WordPress WXR",
-            data=wp_content,
+            data=lambda: download_manager.export_wordpress(content, wp_options, ctx=ctx),
             file_name=wp_filename,
             mime="application/xml",
             use_container_width=True,
@@ -1056,12 +1330,11 @@ def render_publishing_platforms(download_manager: DownloadManager, content: Dict
         medium_include_subtitle = st.checkbox("Include subtitle", value=True, key="medium_subtitle")
         
         medium_options = {'include_subtitle': medium_include_subtitle}
-        medium_content = download_manager.export_medium(content, medium_options)
-        medium_filename = download_manager.generate_filename(content, 'medium')
+        medium_filename = download_manager.generate_filename(content, 'medium', ctx=ctx)
         
         st.download_button(
             "📝 Medium HTML",
-            data=medium_content,
+            data=lambda: download_manager.export_medium(content, medium_options),
             file_name=medium_filename,
             mime="text/html",
             use_container_width=True
@@ -1080,12 +1353,11 @@ def render_publishing_platforms(download_manager: DownloadManager, content: Dict
             'include_hashtags': linkedin_hashtags
         }
         
-        linkedin_content = download_manager.export_linkedin(content, linkedin_options)
-        linkedin_filename = download_manager.generate_filename(content, 'linkedin')
+        linkedin_filename = download_manager.generate_filename(content, 'linkedin', ctx=ctx)
         
         st.download_button(
             "💼 LinkedIn Article",
-            data=linkedin_content,
+            data=lambda: download_manager.export_linkedin(content, linkedin_options),
             file_name=linkedin_filename,
             mime="text/plain",
             use_container_width=True
@@ -1093,12 +1365,11 @@ def render_publishing_platforms(download_manager: DownloadManager, content: Dict
         
         # Email newsletter
         st.markdown("**Email Newsletter**")
-        email_content = download_manager.export_email_template(content)
-        email_filename = download_manager.generate_filename(content, 'email')
+        email_filename = download_manager.generate_filename(content, 'email', ctx=ctx)
         
         st.download_button(
             "📧 Email Template",
-            data=email_content,
+            data=lambda: download_manager.export_email_template(content),
             file_name=email_filename,
             mime="text/html",
             use_container_width=True,
@@ -1139,8 +1410,12 @@ def render_social_media_exports(download_manager: DownloadManager, content: Dict
     st.markdown("### 📱 Social Media Content")
     st.markdown("Generate content optimized for different social media platforms.")
     
-    # Generate social media posts
-    social_posts = download_manager.generate_social_media_posts(content)
+    # One timestamp for every filename and export on this tab
+    ctx = download_manager.export_context()
+    timestamp = ctx['now'].strftime('%Y%m%d_%H%M%S')
+    
+    # Generate social media posts; reruns with an unchanged article reuse the cached posts
+    social_posts = _cached_social_posts(_content_key(content), download_manager, content)
     
     social_col1, social_col2 = st.columns(2)
     
@@ -1158,7 +1433,7 @@ def render_social_media_exports(download_manager: DownloadManager, content: Dict
             st.download_button(
                 "📱 Download Twitter Thread",
                 data=social_posts['twitter'],
-                file_name=f"twitter_thread_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                file_name=f"twitter_thread_{timestamp}.txt",
                 mime="text/plain"
             )
         
@@ -1175,7 +1450,7 @@ def render_social_media_exports(download_manager: DownloadManager, content: Dict
             st.download_button(
                 "📘 Download Facebook Post",
                 data=social_posts['facebook'],
-                file_name=f"facebook_post_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                file_name=f"facebook_post_{timestamp}.txt",
                 mime="text/plain"
             )
     
@@ -1193,7 +1468,7 @@ def render_social_media_exports(download_manager: DownloadManager, content: Dict
             st.download_button(
                 "💼 Download LinkedIn Post",
                 data=social_posts['linkedin'],
-                file_name=f"linkedin_post_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                file_name=f"linkedin_post_{timestamp}.txt",
                 mime="text/plain"
             )
         
@@ -1210,7 +1485,7 @@ def render_social_media_exports(download_manager: DownloadManager, content: Dict
             st.download_button(
                 "📸 Download Instagram Caption",
                 data=social_posts['instagram'],
-                file_name=f"instagram_caption_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                file_name=f"instagram_caption_{timestamp}.txt",
                 mime="text/plain"
             )
     
@@ -1219,54 +1494,59 @@ def render_social_media_exports(download_manager: DownloadManager, content: Dict
     
     st.info("📱 Download all social media content in one convenient package")
     
-    if st.button("🎁 Generate Social Media Package", type="primary"):
-        social_package = download_manager.export_social_media_package(content)
-        package_filename = download_manager.generate_filename(content, 'social_media')
-        
-        st.download_button(
-            "📦 Download Complete Package",
-            data=social_package,
-            file_name=package_filename,
-            mime="application/zip",
-            use_container_width=True,
-            help="Contains posts for all platforms plus email template and metadata"
-        )
+    def build_social_package() -> io.BytesIO:
+        # Deferred: only runs when the button is clicked, not on every rerun
+        package = io.BytesIO()
+        download_manager.export_social_media_package(content, package, ctx=ctx)
+        return package
+    
+    st.download_button(
+        "📦 Download Complete Package",
+        data=build_social_package,
+        file_name=download_manager.generate_filename(content, 'social_media', ctx=ctx),
+        mime="application/zip",
+        type="primary",
+        use_container_width=True,
+        help="Contains posts for all platforms plus email template and metadata"
+    )
 
 def render_analytics_exports(download_manager: DownloadManager, content: Dict):
     """Render analytics and data exports"""
     st.markdown("### 📊 Analytics & Data")
     st.markdown("Export content analytics and structured data for analysis.")
     
+    # One timestamp for every filename and export on this tab; exports are built when their
+    # download is clicked or their preview is switched on
+    ctx = download_manager.export_context()
+    
     analytics_col1, analytics_col2 = st.columns(2)
     
     with analytics_col1:
         st.markdown("#### 📈 Content Analytics")
         
         # CSV analytics export
-        csv_content = download_manager.export_analytics_csv(content)
-        csv_filename = download_manager.generate_filename(content, 'csv')
+        csv_filename = download_manager.generate_filename(content, 'csv', ctx=ctx)
         
         st.download_button(
             "📊 Download Analytics CSV",
-            data=csv_content,
+            data=lambda: download_manager.export_analytics_csv(content),
             file_name=csv_filename,
             mime="text/csv",
             use_container_width=True
         )
         
         # Preview analytics
-        with st.expander("📋 Analytics Preview"):
-            st.text(csv_content)
+        if st.toggle("📋 Show analytics preview", key="analytics_preview"):
+            st.text(download_manager.export_analytics_csv(content))
         
         # Schema markup export
         schema_data = content.get('schema_markup', {})
         if schema_data:
-            schema_json = json.dumps(schema_data, indent=2)
-            schema_filename = download_manager.generate_filename(content, 'schema')
+            schema_filename = download_manager.generate_filename(content, 'schema', ctx=ctx)
             
             st.download_button(
                 "🏷️ Download Schema Markup",
-                data=schema_json,
+                data=lambda: _dump_json(schema_data),
                 file_name=schema_filename,
                 mime="application/json",
                 use_container_width=True
@@ -1291,21 +1571,19 @@ def render_analytics_exports(download_manager: DownloadManager, content: Dict):
             'clean_json': json_clean
         }
         
-        json_content = download_manager.export_json(content, json_options)
-        json_filename = download_manager.generate_filename(content, 'json')
+        json_filename = download_manager.generate_filename(content, 'json', ctx=ctx)
         
         st.download_button(
             "📄 Download JSON Data",
-            data=json_content,
+            data=lambda: download_manager.export_json(content, json_options, ctx=ctx),
             file_name=json_filename,
             mime="application/json",
             use_container_width=True
         )
         
         # JSON preview
-        with st.expander("👁️ JSON Preview"):
-            preview_data = json.loads(json_content)
-            st.json(preview_data)
+        if st.toggle("👁️ Show JSON preview", key="json_preview"):
+            st.json(json.loads(download_manager.export_json(content, json_options, ctx=ctx)))
 
 def render_bulk_download_section(download_manager: DownloadManager, content: Dict):
     """Render bulk download options"""
@@ -0,0 +1,60 @@
+import pytest
+
+from content_input import ContentExtractor, LexborHTMLParser
+
+# A noise container wrapping a div that matches one of the CONTENT_SELECTORS
+NOISY_PAGE = (
+    b'<html><head><title>Noisy page</title></head><body>'
+    b'<aside><div class="content"><p>Related: buy stuff now</p></div></aside>'
+    b'<p>The real article paragraph.</p><p>Another real paragraph.</p>'
+    b'</body></html>'
+)
+
+BACKENDS = ["bs4"] + (["selectolax"] if LexborHTMLParser is not None else [])
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_noise_container_children_are_not_extracted(backend):
+    extractor = ContentExtractor()
+    extractor.HTML_BACKEND = backend
+    
+    data = extractor.parse_html(NOISY_PAGE, "text/html", "https://example.com/a")
+    
+    assert "buy stuff" not in data["content"]
+    assert data["content"] == "The real article paragraph. Another real paragraph."
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_unknown_declared_charset_falls_back_to_detection(backend):
+    extractor = ContentExtractor()
+    extractor.HTML_BACKEND = backend
+    
+    data = extractor.parse_html(NOISY_PAGE, "text/html; charset=bogus-enc", "https://example.com/a")
+    
+    assert data["content"] == "The real article paragraph. Another real paragraph."
+
+
+def test_backends_agree_on_headings_inside_noise_containers():
+    if LexborHTMLParser is None:
+        pytest.skip("selectolax is not installed")
+    
+    page = b'<html><body><header><h1>Site name</h1></header><article><h2>Section</h2><p>Body</p></article></body></html>'
+    results = {}
+    for backend in BACKENDS:
+        extractor = ContentExtractor()
+        extractor.HTML_BACKEND = backend
+        results[backend] = extractor.parse_html(page, "text/html", "https://example.com/a")["headings"]
+    
+    assert results["bs4"] == results["selectolax"] == [{"level": 2, "text": "Section", "tag": "h2"}]
+
+
+def test_combine_articles_keeps_source_order():
+    extractor = ContentExtractor()
+    first = extractor.extract_from_text("First title\nFirst body text.")
+    second = extractor.extract_from_text("Second title\nSecond body text.")
+    
+    combined = extractor.combine_articles([first, second])
+    
+    assert combined["title"] == first["title"]
+    assert combined["content"] == f"{first['content']}\n\n{second['content']}"
+    assert combined["word_count"] == first["word_count"] + second["word_count"]